@@ -24,159 +24,177 @@ Usage:
     from wickit import humanize, landscape, vault
 """
 
-from .hideaway import (
-    get_data_dir,
-    get_config_path,
-    ensure_data_dir,
-    get_project_names,
-    is_product_installed,
-    get_all_product_data_dirs,
-    VALID_PRODUCTS,
-)
+import os
+from importlib import import_module
 
-from .knobs import (
-    Config,
-    AIConfig,
-    SyncConfig,
-    get_config,
-    save_config,
-    get_sync_provider,
-    set_sync_provider,
-    get_ai_config,
-    set_ai_config,
-)
+# Public names grouped by the submodule that defines them. Submodules are
+# imported on first attribute access (PEP 562), so ``import wickit`` only
+# pays for the modules a caller actually uses.
+_EXPORTS = {
+    "hideaway": (
+        "get_data_dir",
+        "get_config_path",
+        "ensure_data_dir",
+        "get_project_names",
+        "is_product_installed",
+        "get_all_product_data_dirs",
+        "VALID_PRODUCTS",
+    ),
+    "knobs": (
+        "Config",
+        "AIConfig",
+        "SyncConfig",
+        "get_config",
+        "save_config",
+        "get_sync_provider",
+        "set_sync_provider",
+        "get_ai_config",
+        "set_ai_config",
+    ),
+    "alter_egos": (
+        "Profile",
+        "list_profiles",
+        "get_default_profile",
+        "create_profile",
+        "delete_profile",
+        "copy_profile",
+        "set_default_profile",
+        "profile_exists",
+    ),
+    "dropzone": (
+        "CloudProvider",
+        "SyncFolder",
+        "SyncStatus",
+        "detect_cloud_folders",
+        "get_default_sync_folder",
+        "create_sync_folder",
+        "get_dropbox_folder",
+        "get_google_drive_folder",
+        "get_onedrive_folder",
+        "get_icloud_folder",
+        "LocalFolderSync",
+    ),
+    "cloudbridge": (
+        "SyncResult",
+        "CloudSync",
+        "DropboxSync",
+        "GoogleDriveSync",
+        "get_cloud_sync_provider",
+        "sync_to_cloud",
+        "restore_from_cloud",
+    ),
+    "autopilot": (
+        "AutoSync",
+        "AutoSyncManager",
+        "AutoSyncConfig",
+    ),
+    "synapse": (
+        "SM2Card",
+        "Deck",
+        "calculate_interval",
+        "review_card",
+        "ease_factor_for_quality",
+        "get_grade_label",
+        "is_due",
+        "get_retention_score",
+        "DEFAULT_EASE_FACTOR",
+        "MIN_EASE_FACTOR",
+        "MAX_EASE_FACTOR",
+    ),
+    "pulse": (
+        "StreakData",
+        "StreakTracker",
+        "RetentionPoint",
+        "RetentionAnalyzer",
+        "ProgressMetrics",
+        "calculate_progress_metrics",
+        "get_retention_message",
+        "get_weak_spots",
+        "get_recommendations",
+        "generate_analytics_summary",
+    ),
+    "blueprint": (
+        "Schema",
+        "FieldSchema",
+        "SchemaError",
+        "validate",
+        "validate_required_fields",
+        "validate_json_file",
+        "make_schema",
+        "safe_validate",
+        "COMMON_SCHEMAS",
+    ),
+    "humanize": (
+        "Mistaker",
+        "MistakeConfig",
+        "should_make_mistake",
+        "get_mistake_info",
+        "get_mistake_warning",
+        "set_mistake_level",
+        "record_answer",
+        "calculate_actual_score",
+        "MISTAKE_LEVELS",
+        "DEFAULT_MISTAKE_LEVEL",
+    ),
+    "landscape": (
+        "Platform",
+        "PlatformCategory",
+        "detect_platform",
+        "get_platform",
+        "get_platforms_by_category",
+        "get_platform_info",
+        "list_platforms",
+        "list_platforms_by_category",
+        "register_platform",
+        "unregister_platform",
+        "categorize_url",
+        "get_all_categories",
+        "PLATFORMS",
+    ),
+    "vault": (
+        "SQLiteDatabase",
+        "DatabaseError",
+        "Transaction",
+        "get_database",
+        "init_database",
+    ),
+    # Listed after vault: the package-level SQLiteDatabase has always been
+    # shelf's, which was imported last and shadowed vault's.
+    "shelf": (
+        "SQLiteDatabase",
+        "get_db_path",
+        "export_database",
+        "list_databases",
+    ),
+    "shuffle": (
+        "ServiceRegistry",
+        "ShuffleError",
+        "NoAvailablePortError",
+        "quick_start",
+    ),
+}
 
-from .alter_egos import (
-    Profile,
-    list_profiles,
-    get_default_profile,
-    create_profile,
-    delete_profile,
-    copy_profile,
-    set_default_profile,
-    profile_exists,
-)
+_SUBMODULES = frozenset(_EXPORTS) | {"flavour"}
 
-from .dropzone import (
-    CloudProvider,
-    SyncFolder,
-    SyncStatus,
-    detect_cloud_folders,
-    get_default_sync_folder,
-    create_sync_folder,
-    get_dropbox_folder,
-    get_google_drive_folder,
-    get_onedrive_folder,
-    get_icloud_folder,
-    LocalFolderSync,
-)
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
 
-from .cloudbridge import (
-    SyncResult,
-    CloudSync,
-    DropboxSync,
-    GoogleDriveSync,
-    get_cloud_sync_provider,
-    sync_to_cloud,
-    restore_from_cloud,
-)
 
-from .autopilot import (
-    AutoSync,
-    AutoSyncManager,
-    AutoSyncConfig,
-)
+def __getattr__(name):
+    """Import the submodule providing ``name`` on first access."""
+    if name in _LAZY:
+        value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
-from .synapse import (
-    SM2Card,
-    Deck,
-    calculate_interval,
-    review_card,
-    ease_factor_for_quality,
-    get_grade_label,
-    is_due,
-    get_retention_score,
-    DEFAULT_EASE_FACTOR,
-    MIN_EASE_FACTOR,
-    MAX_EASE_FACTOR,
-)
 
-from .pulse import (
-    StreakData,
-    StreakTracker,
-    RetentionPoint,
-    RetentionAnalyzer,
-    ProgressMetrics,
-    calculate_progress_metrics,
-    get_retention_message,
-    get_weak_spots,
-    get_recommendations,
-    generate_analytics_summary,
-)
+def __dir__():
+    """List lazily exported names alongside the loaded ones."""
+    return sorted(set(globals()) | set(_LAZY) | _SUBMODULES)
 
-from .blueprint import (
-    Schema,
-    FieldSchema,
-    SchemaError,
-    validate,
-    validate_required_fields,
-    validate_json_file,
-    make_schema,
-    safe_validate,
-    COMMON_SCHEMAS,
-)
-
-from .humanize import (
-    Mistaker,
-    MistakeConfig,
-    should_make_mistake,
-    get_mistake_info,
-    get_mistake_warning,
-    set_mistake_level,
-    record_answer,
-    calculate_actual_score,
-    MISTAKE_LEVELS,
-    DEFAULT_MISTAKE_LEVEL,
-)
-
-from .landscape import (
-    Platform,
-    PlatformCategory,
-    detect_platform,
-    get_platform,
-    get_platforms_by_category,
-    get_platform_info,
-    list_platforms,
-    list_platforms_by_category,
-    register_platform,
-    unregister_platform,
-    categorize_url,
-    get_all_categories,
-    PLATFORMS,
-)
-
-from .vault import (
-    SQLiteDatabase,
-    DatabaseError,
-    Transaction,
-    get_database,
-    init_database,
-)
-
-from .shelf import (
-    SQLiteDatabase,
-    get_db_path,
-    export_database,
-    list_databases,
-)
-
-from .shuffle import (
-    ServiceRegistry,
-    ShuffleError,
-    NoAvailablePortError,
-    
-    quick_start,
-)
 
 __version__ = "0.1.0"
 
@@ -300,6 +318,12 @@ __all__ = [
     "ServiceRegistry",
     "ShuffleError",
     "NoAvailablePortError",
-    
     "quick_start",
 ]
+
+# Set WICKIT_EAGER_IMPORT=1 (e.g. in CI) to import every submodule up front
+# so a broken module fails at import time rather than on first use.
+if os.environ.get("WICKIT_EAGER_IMPORT"):
+    for _name in _LAZY:
+        __getattr__(_name)
+    del _name
@@ -23,10 +23,13 @@ Functions:
 """
 
 import json
+import os
+import shutil
+import time
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from .hideaway import get_data_dir
 
@@ -42,70 +45,98 @@ class Profile:
     modified: str
 
 
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string, e.g. 2024-01-01T00:00:00."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
+
+
+@lru_cache(maxsize=64)
+def _meta_filename(product_name: str) -> str:
+    """Name of the product's profile metadata file."""
+    return f".{product_name.replace('-', '')}.json"
+
+
 def list_profiles(product_name: str) -> list[Profile]:
     """List all profiles for a product."""
     data_dir = get_data_dir(product_name)
     if not data_dir.exists():
         return []
 
-    profiles = []
-    for entry in data_dir.iterdir():
-        if entry.is_dir() and not entry.name.startswith("."):
-            profile = _load_profile(entry, product_name)
-            if profile:
-                profiles.append(profile)
+    load = _make_loader(product_name)
+    with os.scandir(data_dir) as it:
+        entries = [e for e in it if not e.name.startswith(".") and e.is_dir()]
+    profiles = [p for p in (load(Path(e.path)) for e in entries) if p]
 
     return sorted(profiles, key=lambda p: p.name)
 
 
 def get_default_profile(product_name: str) -> Optional[Profile]:
     """Get the default profile for a product."""
+    data_dir = get_data_dir(product_name)
+    if not data_dir.exists():
+        return None
+
+    # Find the marked profile with one stat per directory, loading only it.
+    with os.scandir(data_dir) as it:
+        marked = [
+            Path(e.path) for e in it
+            if not e.name.startswith(".") and e.is_dir()
+            and os.path.exists(os.path.join(e.path, ".default"))
+        ]
+    if marked:
+        load = _make_loader(product_name)
+        return min((load(path) for path in marked), key=lambda p: p.name)
+
+    # No default: the first profile by name needs every profile's metadata.
     profiles = list_profiles(product_name)
-    for profile in profiles:
-        if profile.is_default:
-            return profile
     return profiles[0] if profiles else None
 
 
-def _load_profile(path: Path, product_name: str) -> Optional[Profile]:
-    """Load a profile from disk."""
-    metadata_files = [
-        path / f".{product_name.replace('-', '')}.json",
-        path / ".profile.json",
-        path / ".default",
-    ]
-
-    metadata_file = None
-    for mf in metadata_files:
-        if mf.exists():
-            metadata_file = mf
-            break
+@lru_cache(maxsize=32)
+def _make_loader(product_name: str) -> Callable[[Path], Optional[Profile]]:
+    """Build a profile loader with the product's metadata names precomputed."""
+    metadata_names = (_meta_filename(product_name), ".profile.json", ".default")
 
-    is_default = (path / ".default").exists()
-
-    if metadata_file and metadata_file.exists():
+    def load(path: Path) -> Optional[Profile]:
+        # One directory listing answers every "does this dotfile exist?" probe.
         try:
-            with open(metadata_file) as f:
-                data = json.load(f)
-            return Profile(
-                id=path.name,
-                name=data.get("name", path.name),
-                path=path,
-                is_default=is_default,
-                created=data.get("created", ""),
-                modified=data.get("modified", ""),
-            )
-        except (json.JSONDecodeError, IOError):
-            pass
+            with os.scandir(path) as it:
+                present = {entry.name for entry in it if entry.name.startswith(".")}
+        except OSError:
+            present = set()
+
+        metadata_name = next((name for name in metadata_names if name in present), None)
+        is_default = ".default" in present
+
+        if metadata_name:
+            try:
+                data = json.loads((path / metadata_name).read_bytes())
+                return Profile(
+                    id=path.name,
+                    name=data.get("name", path.name),
+                    path=path,
+                    is_default=is_default,
+                    created=data.get("created", ""),
+                    modified=data.get("modified", ""),
+                )
+            except (OSError, ValueError):
+                pass
+
+        return Profile(
+            id=path.name,
+            name=path.name,
+            path=path,
+            is_default=is_default,
+            created="",
+            modified="",
+        )
+
+    return load
 
-    return Profile(
-        id=path.name,
-        name=path.name,
-        path=path,
-        is_default=is_default,
-        created="",
-        modified="",
-    )
+
+def _load_profile(path: Path, product_name: str) -> Optional[Profile]:
+    """Load a profile from disk."""
+    return _make_loader(product_name)(path)
 
 
 def create_profile(product_name: str, profile_name: str) -> Profile:
@@ -116,9 +147,9 @@ def create_profile(product_name: str, profile_name: str) -> Profile:
     profile_path.mkdir(parents=True, exist_ok=True)
     (profile_path / "data").mkdir(exist_ok=True)
 
-    now = datetime.utcnow().isoformat()
+    now = _utc_now_iso()
 
-    metadata_file = profile_path / f".{product_name.replace('-', '')}.json"
+    metadata_file = profile_path / _meta_filename(product_name)
     metadata = {
         "name": profile_name,
         "created": now,
@@ -139,7 +170,6 @@ def create_profile(product_name: str, profile_name: str) -> Profile:
 
 def delete_profile(product_name: str, profile_id: str) -> bool:
     """Delete a profile."""
-    import shutil
     data_dir = get_data_dir(product_name)
     profile_path = data_dir / profile_id
 
@@ -152,7 +182,6 @@ def delete_profile(product_name: str, profile_id: str) -> bool:
 
 def copy_profile(product_name: str, source_id: str, target_name: str) -> Optional[Profile]:
     """Copy a profile to a new profile."""
-    import shutil
     data_dir = get_data_dir(product_name)
     source_path = data_dir / source_id
 
@@ -162,12 +191,14 @@ def copy_profile(product_name: str, source_id: str, target_name: str) -> Optiona
     target_path = data_dir / target_name.lower().replace(" ", "-")
     shutil.copytree(source_path, target_path)
 
-    now = datetime.utcnow().isoformat()
-    metadata_file = target_path / f".{product_name.replace('-', '')}.json"
+    now = _utc_now_iso()
+    metadata_file = target_path / _meta_filename(product_name)
 
-    if metadata_file.exists():
-        with open(metadata_file) as f:
-            metadata = json.load(f)
+    try:
+        metadata = json.loads(metadata_file.read_bytes())
+    except FileNotFoundError:
+        pass
+    else:
         metadata["name"] = target_name
         metadata["modified"] = now
         with open(metadata_file, "w") as f:
@@ -1,7 +1,9 @@
 """autopilot - Auto-Sync Watcher.
 
 Automatic file synchronization with directory watching and change detection.
-Watches for file modifications and syncs to cloud storage.
+Watches for file modifications and syncs to cloud storage. Uses filesystem
+events from watchdog when it is installed (``wickit[watch]``) and falls back
+to polling otherwise.
 
 Example:
     >>> from wickit import autopilot
@@ -22,13 +24,55 @@ Functions:
 """
 
 import hashlib
+import json
+import logging
 import os
+import queue
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# hashlib.file_digest streams the file without copying it into Python (3.11+).
+_file_digest = getattr(hashlib, "file_digest", None)
+_HASH_CHUNK_SIZE = 64 * 1024
+
+# Filters for the watched tree; hidden directories are skipped as well.
+_SKIP_DIRS = frozenset({".backups"})
+_INCLUDE_SUFFIXES = (".json",)
+_EXCLUDE_SUFFIXES = (".zip",)
+
+# How long a removed file's metadata is kept in case it is re-created.
+_REMOVED_TTL = 5.0
+
+# Watchdog event types that mean a file's content or location changed; access
+# events (opened, closed, closed_no_write) are ignored.
+_CHANGE_EVENTS = frozenset({"created", "modified", "moved", "deleted"})
+
+# Directory listings are only reused once the directory's mtime is older than
+# this, so changes within one timestamp tick of a coarse filesystem are seen.
+_RACY_MTIME_NS = 2 * 10**9
+
+
+def _is_skipped_dir(name: str) -> bool:
+    return name in _SKIP_DIRS or name[:1] == "."
+
+
+def _is_tracked_name(name: str) -> bool:
+    return name.endswith(_INCLUDE_SUFFIXES) and not name.endswith(_EXCLUDE_SUFFIXES)
+
+
+def _run_callback(callback: Callable, *args) -> None:
+    """Run a sync callback; a failing callback must not kill the watcher thread."""
+    try:
+        callback(*args)
+    except Exception:
+        logger.exception("AutoSync callback %r failed", callback)
 
 
 @dataclass
@@ -39,6 +83,7 @@ class AutoSyncConfig:
     access_token: Optional[str] = None
     debounce_seconds: float = 2.0
     poll_interval: float = 0.5
+    canonicalize_json: bool = True
 
 
 class AutoSync:
@@ -50,18 +95,32 @@ class AutoSync:
         provider: str = "dropbox",
         access_token: Optional[str] = None,
         debounce_seconds: float = 2.0,
-        on_sync: Optional[Callable] = None
+        on_sync: Optional[Callable] = None,
+        canonicalize_json: bool = True
     ):
         self.product_dir = product_dir
         self.provider = provider
         self._access_token = access_token
         self.debounce_seconds = debounce_seconds
         self.on_sync = on_sync
+        self.canonicalize_json = canonicalize_json
 
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._file_hashes: dict[str, str] = {}
-        self._callbacks: set[Callable] = set()
+        self._stop_event = threading.Event()
+        self._observer = None
+        self._hash_pool: Optional[ThreadPoolExecutor] = None
+        self._events: queue.Queue = queue.Queue()
+        # path -> ((st_mtime_ns, st_size, st_ino, st_dev), content digest)
+        self._file_meta: dict[str, tuple[tuple[int, int, int, int], str]] = {}
+        # path -> (monotonic removal time, last metadata) for recently removed files
+        self._removed: dict[str, tuple[float, tuple[tuple[int, int, int, int], str]]] = {}
+        # directory -> (st_mtime_ns, tracked files, subdirectories)
+        self._dir_cache: dict[str, tuple[int, list[str], list[str]]] = {}
+        self._visited_dirs: set[str] = set()
+        # Replaced, never mutated, so readers can iterate without a lock.
+        self._callbacks: tuple[Callable, ...] = ()
+        self._callbacks_lock = threading.Lock()
 
     def set_access_token(self, token: str) -> None:
         """Set the cloud provider access token."""
@@ -72,44 +131,146 @@ class AutoSync:
         if self._running:
             return
         self._running = True
-        self._thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self._stop_event.clear()
+        target = self._event_loop if self._start_observer() else self._watch_loop
+        self._thread = threading.Thread(target=target, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         """Stop the auto-sync watcher."""
         self._running = False
+        self._stop_event.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5.0)
+            self._observer = None
+        self._events.put(None)
         if self._thread:
             self._thread.join(timeout=5.0)
             self._thread = None
+        if self._hash_pool is not None:
+            self._hash_pool.shutdown(wait=False)
+            self._hash_pool = None
 
     def add_callback(self, callback: Callable) -> None:
         """Add a callback to be called after sync."""
-        self._callbacks.add(callback)
+        with self._callbacks_lock:
+            if callback not in self._callbacks:
+                self._callbacks = self._callbacks + (callback,)
 
     def remove_callback(self, callback: Callable) -> None:
         """Remove a sync callback."""
-        self._callbacks.discard(callback)
-
-    def _compute_hash(self, file_path: Path) -> str:
-        """Compute a simple hash for file content."""
-        content = file_path.read_bytes()
-        return hashlib.md5(content).hexdigest()
-
-    def _get_tracked_files(self) -> list[Path]:
-        """Get list of files to track for changes."""
-        files = []
-        for root, dirs, filenames in os.walk(self.product_dir):
-            dirs[:] = [d for d in dirs if d != ".backups" and not d.startswith(".")]
-            for filename in filenames:
-                if filename.endswith(".json") and not filename.endswith(".zip"):
-                    files.append(Path(root) / filename)
-        return files
+        with self._callbacks_lock:
+            self._callbacks = tuple(cb for cb in self._callbacks if cb != callback)
+
+    def _compute_hash(self, file_path: Union[Path, str]) -> str:
+        """Compute a BLAKE2b hash of file content.
+
+        With canonicalize_json, valid JSON is hashed in a canonical form so
+        reformatting or reordering keys is not seen as a change.
+        """
+        if self.canonicalize_json:
+            with open(file_path, "rb") as f:
+                data = f.read()
+            try:
+                data = json.dumps(json.loads(data), sort_keys=True, separators=(",", ":")).encode()
+            except (ValueError, RecursionError):
+                pass
+            return hashlib.blake2b(data).hexdigest()
+
+        with open(file_path, "rb") as f:
+            if _file_digest is not None:
+                return _file_digest(f, "blake2b").hexdigest()
+            digest = hashlib.blake2b()
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _is_tracked_path(self, path: str) -> bool:
+        """Check whether a changed path is one _iter_tracked would yield."""
+        try:
+            parts = Path(path).relative_to(self.product_dir).parts
+        except ValueError:
+            return False
+        if not parts or any(_is_skipped_dir(part) for part in parts[:-1]):
+            return False
+        return _is_tracked_name(parts[-1])
+
+    def _start_observer(self) -> bool:
+        """Start a watchdog observer, returning False if polling must be used."""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return False
+
+        sync = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory or event.event_type not in _CHANGE_EVENTS:
+                    return
+                paths = (event.src_path, getattr(event, "dest_path", ""))
+                if any(path and sync._is_tracked_path(os.fsdecode(path)) for path in paths):
+                    sync._events.put(event)
+
+        observer = Observer()
+        try:
+            observer.schedule(_Handler(), str(self.product_dir), recursive=True)
+            observer.daemon = True
+            observer.start()
+        except OSError:
+            return False
+        self._observer = observer
+        return True
+
+    def _list_dir(self, root: str) -> tuple[list[str], list[str]]:
+        """Return the tracked files and subdirectories of root.
+
+        Adding, removing or renaming an entry bumps the directory's mtime, so
+        a listing is reused for as long as that mtime is unchanged.
+        """
+        self._visited_dirs.add(root)
+        try:
+            mtime = os.stat(root).st_mtime_ns
+        except OSError:
+            return [], []
+        cached = self._dir_cache.get(root)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        files, dirs = [], []
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _is_skipped_dir(name):
+                            dirs.append(entry.path)
+                    elif _is_tracked_name(name):
+                        files.append(entry.path)
+        except OSError:
+            return [], []
+        if time.time_ns() - mtime > _RACY_MTIME_NS:
+            self._dir_cache[root] = (mtime, files, dirs)
+        else:
+            self._dir_cache.pop(root, None)
+        return files, dirs
+
+    def _iter_tracked(self, root: Union[Path, str]) -> Iterator[str]:
+        """Yield the paths of the files to track under root."""
+        files, dirs = self._list_dir(os.fspath(root))
+        yield from files
+        for subdir in dirs:
+            yield from self._iter_tracked(subdir)
 
     def _sync_now(self) -> dict:
         """Perform sync now."""
         if not self._access_token:
             return {"success": False, "message": "No access token set"}
 
+        # Imported here on purpose: cloudbridge pulls in the HTTP client
+        # libraries, which a watcher that never syncs should not load.
         from .cloudbridge import sync_to_cloud
         product_name = self.product_dir.name.replace(".", "").replace("-", " ")
         result = sync_to_cloud(
@@ -124,45 +285,122 @@ class AutoSync:
             "error": result.error
         }
 
+    def _scan_changes(self) -> list[str]:
+        """Return tracked files whose content changed since the last scan.
+
+        Files are stat'ed first and only hashed when their mtime, size or
+        inode differs from the cached value, so an idle tree is never read.
+        """
+        stale = []
+        self._visited_dirs = set()
+        seen = set(self._iter_tracked(self.product_dir))
+        for key in seen:
+            try:
+                st = os.stat(key)
+            except OSError:
+                continue
+            stamp = (st.st_mtime_ns, st.st_size, st.st_ino, st.st_dev)
+            cached = self._file_meta.get(key)
+            if cached is None:
+                cached = self._pop_removed(key)
+            if cached is None or cached[0] != stamp:
+                stale.append((key, stamp, cached))
+        self._forget_removed(seen)
+        for root in self._dir_cache.keys() - self._visited_dirs:
+            del self._dir_cache[root]
+
+        changed = []
+        digests = self._hash_files([key for key, _, _ in stale])
+        for (key, stamp, cached), digest in zip(stale, digests):
+            if digest is None:
+                continue
+            self._file_meta[key] = (stamp, digest)
+            # A rewrite with identical content changes the stat but not the digest.
+            if cached is None or cached[1] != digest:
+                changed.append(key)
+        return changed
+
+    def _try_hash(self, key: str) -> Optional[str]:
+        """Hash a file, or return None if it can no longer be read."""
+        try:
+            return self._compute_hash(key)
+        except OSError:
+            return None
+
+    def _hash_files(self, keys: list[str]) -> list[Optional[str]]:
+        """Hash files, spreading bursts of several files over a thread pool."""
+        if len(keys) <= 1:
+            return [self._try_hash(key) for key in keys]
+        if self._hash_pool is None:
+            self._hash_pool = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 2),
+                thread_name_prefix="autosync-hash",
+            )
+        return list(self._hash_pool.map(self._try_hash, keys))
+
+    def _pop_removed(self, key: str) -> Optional[tuple[tuple[int, int, int, int], str]]:
+        """Take the metadata of a file removed within _REMOVED_TTL, if any."""
+        removed = self._removed.pop(key, None)
+        if removed is not None and time.monotonic() - removed[0] <= _REMOVED_TTL:
+            return removed[1]
+        return None
+
+    def _forget_removed(self, seen: set[str]) -> None:
+        """Move files missing from a scan to the removed cache and expire it."""
+        now = time.monotonic()
+        for key in self._file_meta.keys() - seen:
+            self._removed[key] = (now, self._file_meta.pop(key))
+        expired = [key for key, (removed_at, _) in self._removed.items() if now - removed_at > _REMOVED_TTL]
+        for key in expired:
+            del self._removed[key]
+
+    def _notify_sync(self) -> None:
+        """Sync and run the sync callbacks."""
+        result = self._sync_now()
+        callbacks = self._callbacks
+        if self.on_sync:
+            _run_callback(self.on_sync, result)
+        for cb in callbacks:
+            _run_callback(cb)
+
     def _watch_loop(self) -> None:
-        """Main watch loop."""
-        initial_files = self._get_tracked_files()
-        for f in initial_files:
-            if f.exists():
-                self._file_hashes[str(f)] = self._compute_hash(f)
+        """Polling watch loop, used when watchdog is not installed."""
+        self._scan_changes()
+
+        while not self._stop_event.wait(0.5):
+            if not self._scan_changes():
+                continue
+
+            # Wait for the files to settle before syncing.
+            while not self._stop_event.wait(self.debounce_seconds):
+                if not self._scan_changes():
+                    break
+            else:
+                return
+
+            self._notify_sync()
+
+    def _event_loop(self) -> None:
+        """Watch loop driven by filesystem events from watchdog."""
+        self._scan_changes()
 
         while self._running:
-            time.sleep(0.5)
-            current_files = self._get_tracked_files()
-            changed_files = []
-
-            for f in current_files:
-                f_str = str(f)
-                if not f.exists():
-                    continue
-                current_hash = self._compute_hash(f)
-                if f_str not in self._file_hashes:
-                    changed_files.append(f)
-                elif self._file_hashes[f_str] != current_hash:
-                    changed_files.append(f)
-
-            if changed_files:
-                for f in changed_files:
-                    self._file_hashes[str(f)] = self._compute_hash(f)
-                time.sleep(self.debounce_seconds)
-                still_changing = False
-                for f in changed_files:
-                    if f.exists():
-                        new_hash = self._compute_hash(f)
-                        if new_hash != self._file_hashes.get(str(f), ""):
-                            still_changing = True
-                            break
-                if not still_changing:
-                    result = self._sync_now()
-                    if self.on_sync:
-                        self.on_sync(result)
-                    for cb in self._callbacks:
-                        cb()
+            try:
+                self._events.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            # Coalesce events until none arrive for debounce_seconds.
+            while self._running:
+                try:
+                    self._events.get(timeout=self.debounce_seconds)
+                except queue.Empty:
+                    break
+            else:
+                return
+
+            if self._scan_changes():
+                self._notify_sync()
 
     def sync_once(self) -> dict:
         """Perform a single sync."""
@@ -177,20 +415,26 @@ class AutoSyncManager:
     """Global auto-sync manager for the application."""
 
     _instance: Optional["AutoSyncManager"] = None
-    _sync: Optional[AutoSync] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._sync: Optional[AutoSync] = None
 
     @classmethod
     def get_instance(cls) -> "AutoSyncManager":
+        # Double-checked so the common already-created path takes no lock.
         if cls._instance is None:
-            cls._instance = cls()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
     @classmethod
     def reset(cls) -> None:
-        if cls._instance and cls._instance._sync:
-            cls._instance._sync.stop()
-        cls._instance = None
-        cls._sync = None
+        with cls._instance_lock:
+            if cls._instance and cls._instance._sync:
+                cls._instance._sync.stop()
+            cls._instance = None
 
     def start_autosync(
         self,
@@ -20,15 +20,157 @@ Functions:
     restore_from_cloud: Download from cloud storage.
 """
 
+import hashlib
+import io
 import json
+import logging
 import os
+import posixpath
+import queue
+import time
+import uuid
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-
-
-@dataclass
+from typing import Iterator, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+_STREAM_CHUNK_SIZE = 1 << 20
+# Dropbox rejects /files/upload bodies over 150 MB; larger files use upload sessions.
+_DROPBOX_SINGLE_UPLOAD_LIMIT = 150 * 1024 * 1024
+_DROPBOX_SESSION_CHUNK_SIZE = 16 * 1024 * 1024
+# Concurrent transfers per sync; kept well below the session's pool size.
+_TRANSFER_WORKERS = 8
+# Idle chunk buffers kept for reuse; each can be a full upload-session chunk.
+_BUFFER_POOL_SIZE = 4
+_BUFFER_POOL: "queue.LifoQueue[bytearray]" = queue.LifoQueue(maxsize=_BUFFER_POOL_SIZE)
+# Dropbox-API-Arg bodies with a fixed shape; only the JSON-encoded path varies.
+_DROPBOX_UPLOAD_ARG = '{{"path": {path}, "mode": "overwrite", "autorename": false, "mute": false}}'
+_DROPBOX_DOWNLOAD_ARG = '{{"path": {path}}}'
+# Dropbox content_hash: SHA-256 over the concatenated SHA-256 of each 4 MB block.
+_DROPBOX_HASH_BLOCK_SIZE = 4 * 1024 * 1024
+# How long a Dropbox folder listing is reused before it is fetched again.
+_LIST_CACHE_TTL = 30.0
+
+
+def _new_session():
+    """Create a pooled HTTP session; requests is imported only when needed."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # Rate limits and transient server errors are retried in the transport with
+    # exponential backoff (honouring Retry-After). File bodies are rewound by
+    # urllib3 before each retry; the final response is returned, not raised.
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST", "PUT"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+def _json_loads(body: bytes):
+    """Decode a JSON response body, using orjson when it is installed."""
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def _json_body(obj) -> bytes:
+    """Encode a JSON request body, using orjson when it is installed."""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+
+@contextmanager
+def _borrow_buffer(size: int):
+    """Lend a reusable bytearray of at least size bytes."""
+    try:
+        buf = _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        buf = None
+    if buf is None or len(buf) < size:
+        buf = bytearray(size)
+    try:
+        yield buf
+    finally:
+        try:
+            _BUFFER_POOL.put_nowait(buf)
+        except queue.Full:
+            pass
+
+
+def _dropbox_content_hash(path: Path) -> str:
+    """Compute the Dropbox content_hash of a local file."""
+    block_digests = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(_DROPBOX_HASH_BLOCK_SIZE):
+            block_digests.update(hashlib.sha256(block).digest())
+    return block_digests.hexdigest()
+
+
+class _MultipartRelatedBody:
+    """File-like multipart/related body that streams its file part from disk."""
+
+    def __init__(self, metadata: dict, file, content_type: str = "application/octet-stream"):
+        boundary = uuid.uuid4().hex
+        head = (
+            f"--{boundary}\r\n"
+            "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+            f"{json.dumps(metadata)}\r\n"
+            f"--{boundary}\r\n"
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        tail = f"\r\n--{boundary}--\r\n".encode()
+        self.content_type = f"multipart/related; boundary={boundary}"
+        self._length = len(head) + os.fstat(file.fileno()).st_size + len(tail)
+        self._parts = [(io.BytesIO(head), 0), (file, file.tell()), (io.BytesIO(tail), 0)]
+        self._index = 0
+        self._pos = 0
+
+    def __len__(self) -> int:
+        # requests reads this to send a Content-Length instead of chunking.
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        out = bytearray()
+        while self._index < len(self._parts) and (size < 0 or len(out) < size):
+            chunk = self._parts[self._index][0].read(-1 if size < 0 else size - len(out))
+            if chunk:
+                out += chunk
+            else:
+                self._index += 1
+        self._pos += len(out)
+        return bytes(out)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        # urllib3 rewinds the body to the start before retrying a request.
+        if offset != 0 or whence != os.SEEK_SET:
+            raise io.UnsupportedOperation("multipart body can only be rewound to the start")
+        for stream, start in self._parts:
+            stream.seek(start)
+        self._index = 0
+        self._pos = 0
+        return 0
+
+
+@dataclass(frozen=True, slots=True)
 class SyncResult:
     """Result of a sync operation."""
     success: bool
@@ -60,23 +202,76 @@ class CloudSync(ABC):
     def disconnect(self) -> None:
         pass
 
+    def remote_hashes(self, folder_path: str) -> dict[str, str]:
+        """Map lower-cased remote paths under folder_path to content hashes."""
+        return {}
+
+    def remote_hash(self, remote_path: str) -> Optional[str]:
+        """Content hash of a single remote file, or None if unknown."""
+        return None
+
+    def content_hash(self, local_path: Path) -> Optional[str]:
+        """Hash a local file the way remote_hashes() reports it, if supported."""
+        return None
+
+    def _http(self):
+        """Return the provider's HTTP session, creating it on first use."""
+        if self._session is None:
+            self._session = _new_session()
+        return self._session
+
+    @staticmethod
+    def _save_stream(response, local_path: Path) -> None:
+        """Write a streamed response body to local_path chunk by chunk."""
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and rename, so a dropped connection never
+        # leaves a truncated file in place of the previous copy.
+        partial = local_path.with_name(local_path.name + ".part")
+        try:
+            with open(partial, "wb") as f:
+                for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                    f.write(chunk)
+            os.replace(partial, local_path)
+        finally:
+            if partial.exists():
+                partial.unlink()
+
+    def _close_session(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
 
 class DropboxSync(CloudSync):
     """Dropbox sync implementation."""
 
     def __init__(self):
         self._access_token: Optional[str] = None
+        self._session = None
         self._base_url = "https://api.dropboxapi.com/2"
         self._content_url = "https://content.dropboxapi.com/2"
+        # (folder key, recursive) -> (monotonic fetch time, listed entries)
+        self._list_cache: dict[tuple[str, bool], tuple[float, list[dict]]] = {}
 
     def connect(self, access_token: str) -> bool:
         self._access_token = access_token
+        self._list_cache.clear()
         return self._verify_connection()
 
+    @staticmethod
+    def _folder_key(folder_path: str) -> str:
+        # Dropbox paths are case-insensitive and "" names the root folder.
+        return folder_path.rstrip("/").lower()
+
+    def _invalidate_listing(self, remote_path: str) -> None:
+        parent = self._folder_key(remote_path.rsplit("/", 1)[0])
+        for folder, recursive in list(self._list_cache):
+            if folder == parent or (recursive and f"{parent}/".startswith(f"{folder}/")):
+                self._list_cache.pop((folder, recursive), None)
+
     def _verify_connection(self) -> bool:
         try:
-            import requests
-            response = requests.post(
+            response = self._http().post(
                 f"{self._base_url}/users/get_current_account",
                 headers={"Authorization": f"Bearer {self._access_token}"},
                 data="null"
@@ -87,76 +282,184 @@ class DropboxSync(CloudSync):
 
     def upload(self, local_path: Path, remote_path: str) -> bool:
         try:
-            import requests
             if not self._access_token:
                 raise ValueError("Not connected to Dropbox")
 
-            with open(local_path, "rb") as f:
-                data = f.read()
+            self._invalidate_listing(remote_path)
+            if os.path.getsize(local_path) > _DROPBOX_SINGLE_UPLOAD_LIMIT:
+                return self._upload_large(local_path, remote_path)
 
-            response = requests.post(
-                f"{self._content_url}/files/upload",
-                headers={
-                    "Authorization": f"Bearer {self._access_token}",
-                    "Content-Type": "application/octet-stream",
-                    "Dropbox-API-Arg": json.dumps({
-                        "path": remote_path,
-                        "mode": "overwrite",
-                        "autorename": False,
-                        "mute": False
-                    })
-                },
-                data=data
-            )
+            with open(local_path, "rb") as f:
+                response = self._http().post(
+                    f"{self._content_url}/files/upload",
+                    headers={
+                        "Authorization": f"Bearer {self._access_token}",
+                        "Content-Type": "application/octet-stream",
+                        "Content-Length": str(os.fstat(f.fileno()).st_size),
+                        "Dropbox-API-Arg": _DROPBOX_UPLOAD_ARG.format(path=json.dumps(remote_path))
+                    },
+                    data=f
+                )
             return response.status_code == 200
         except Exception:
+            logger.warning("Dropbox upload of %s failed", local_path, exc_info=True)
             return False
 
+    def _upload_large(
+        self,
+        local_path: Path,
+        remote_path: str,
+        chunk_size: int = _DROPBOX_SESSION_CHUNK_SIZE
+    ) -> bool:
+        """Upload a file in chunks through a Dropbox upload session."""
+        http = self._http()
+        url = f"{self._content_url}/files/upload_session"
+        headers = {
+            "Authorization": f"Bearer {self._access_token}",
+            "Content-Type": "application/octet-stream",
+        }
+
+        with open(local_path, "rb") as f, _borrow_buffer(chunk_size) as buf:
+            # Every chunk is read into the same buffer and sent as a view of it.
+            view = memoryview(buf)[:chunk_size]
+
+            def read_chunk() -> memoryview:
+                return view[:f.readinto(view)]
+
+            size = os.fstat(f.fileno()).st_size
+            response = http.post(
+                f"{url}/start",
+                headers={**headers, "Dropbox-API-Arg": json.dumps({"close": False})},
+                data=read_chunk()
+            )
+            if response.status_code != 200:
+                return False
+            cursor = {"session_id": response.json()["session_id"], "offset": f.tell()}
+
+            while size - cursor["offset"] > chunk_size:
+                response = http.post(
+                    f"{url}/append_v2",
+                    headers={**headers, "Dropbox-API-Arg": json.dumps({"cursor": cursor, "close": False})},
+                    data=read_chunk()
+                )
+                if response.status_code != 200:
+                    return False
+                cursor["offset"] = f.tell()
+
+            commit = {"path": remote_path, "mode": "overwrite", "autorename": False, "mute": False}
+            response = http.post(
+                f"{url}/finish",
+                headers={**headers, "Dropbox-API-Arg": json.dumps({"cursor": cursor, "commit": commit})},
+                data=read_chunk()
+            )
+        return response.status_code == 200
+
     def download(self, remote_path: str, local_path: Path) -> bool:
         try:
-            import requests
             if not self._access_token:
                 raise ValueError("Not connected to Dropbox")
 
-            response = requests.post(
+            with self._http().post(
                 f"{self._content_url}/files/download",
                 headers={
                     "Authorization": f"Bearer {self._access_token}",
-                    "Dropbox-API-Arg": json.dumps({"path": remote_path})
-                }
-            )
-            if response.status_code == 200:
-                local_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(local_path, "wb") as f:
-                    f.write(response.content)
-                return True
-            return False
+                    "Dropbox-API-Arg": _DROPBOX_DOWNLOAD_ARG.format(path=json.dumps(remote_path))
+                },
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    return False
+                self._save_stream(response, local_path)
+            return True
         except Exception:
+            logger.warning("Dropbox download of %s failed", remote_path, exc_info=True)
             return False
 
+    def _list_entries(self, folder_path: str, recursive: bool = False) -> list[dict]:
+        """Return every list_folder entry for folder_path, cached briefly."""
+        if not self._access_token:
+            raise ValueError("Not connected to Dropbox")
+
+        key = (self._folder_key(folder_path), recursive)
+        cached = self._list_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _LIST_CACHE_TTL:
+            return cached[1]
+
+        http = self._http()
+        headers = {
+            "Authorization": f"Bearer {self._access_token}",
+            "Content-Type": "application/json"
+        }
+        response = http.post(
+            f"{self._base_url}/files/list_folder",
+            headers=headers,
+            data=_json_body({"path": folder_path.rstrip("/"), "recursive": recursive})
+        )
+        if response.status_code != 200:
+            return []
+        data = _json_loads(response.content)
+        entries = data.get("entries", [])
+
+        # Large folders are returned in pages; follow the cursor to the end.
+        while data.get("has_more"):
+            response = http.post(
+                f"{self._base_url}/files/list_folder/continue",
+                headers=headers,
+                data=_json_body({"cursor": data["cursor"]})
+            )
+            if response.status_code != 200:
+                return []
+            data = _json_loads(response.content)
+            entries.extend(data.get("entries", []))
+
+        self._list_cache[key] = (time.monotonic(), entries)
+        return entries
+
     def list_files(self, folder_path: str) -> list[str]:
         try:
-            import requests
+            return [entry["path_lower"] for entry in self._list_entries(folder_path)]
+        except Exception:
+            logger.warning("Dropbox listing of %s failed", folder_path, exc_info=True)
+            return []
+
+    def remote_hashes(self, folder_path: str) -> dict[str, str]:
+        try:
+            return {
+                entry["path_lower"]: entry["content_hash"]
+                for entry in self._list_entries(folder_path, recursive=True)
+                if "content_hash" in entry
+            }
+        except Exception:
+            logger.warning("Dropbox listing of %s failed", folder_path, exc_info=True)
+            return {}
+
+    def remote_hash(self, remote_path: str) -> Optional[str]:
+        try:
             if not self._access_token:
                 raise ValueError("Not connected to Dropbox")
 
-            response = requests.post(
-                f"{self._base_url}/files/list_folder",
+            response = self._http().post(
+                f"{self._base_url}/files/get_metadata",
                 headers={
                     "Authorization": f"Bearer {self._access_token}",
                     "Content-Type": "application/json"
                 },
-                data=json.dumps({"path": folder_path, "recursive": False})
+                data=_json_body({"path": remote_path})
             )
-            if response.status_code == 200:
-                data = response.json()
-                return [entry["path_lower"] for entry in data.get("entries", [])]
-            return []
+            if response.status_code != 200:
+                return None
+            return _json_loads(response.content).get("content_hash")
         except Exception:
-            return []
+            logger.warning("Dropbox metadata lookup of %s failed", remote_path, exc_info=True)
+            return None
+
+    def content_hash(self, local_path: Path) -> Optional[str]:
+        return _dropbox_content_hash(local_path)
 
     def disconnect(self) -> None:
         self._access_token = None
+        self._list_cache.clear()
+        self._close_session()
 
 
 class GoogleDriveSync(CloudSync):
@@ -164,7 +467,9 @@ class GoogleDriveSync(CloudSync):
 
     def __init__(self):
         self._access_token: Optional[str] = None
+        self._session = None
         self._base_url = "https://www.googleapis.com/drive/v3"
+        self._upload_url = "https://www.googleapis.com/upload/drive/v3"
 
     def connect(self, access_token: str) -> bool:
         self._access_token = access_token
@@ -172,8 +477,7 @@ class GoogleDriveSync(CloudSync):
 
     def _verify_connection(self) -> bool:
         try:
-            import requests
-            response = requests.get(
+            response = self._http().get(
                 f"{self._base_url}/about",
                 headers={"Authorization": f"Bearer {self._access_token}"}
             )
@@ -183,51 +487,50 @@ class GoogleDriveSync(CloudSync):
 
     def upload(self, local_path: Path, remote_path: str) -> bool:
         try:
-            import requests
             if not self._access_token:
                 raise ValueError("Not connected to Google Drive")
 
             with open(local_path, "rb") as f:
-                files = {"file": f}
-                data = {"fields": "id,name"}
-
-            response = requests.post(
-                f"{self._base_url}/files",
-                headers={"Authorization": f"Bearer {self._access_token}"},
-                files=files,
-                data=data
-            )
+                body = _MultipartRelatedBody({"name": remote_path.rsplit("/", 1)[-1]}, f)
+                response = self._http().post(
+                    f"{self._upload_url}/files",
+                    params={"uploadType": "multipart", "fields": "id,name"},
+                    headers={
+                        "Authorization": f"Bearer {self._access_token}",
+                        "Content-Type": body.content_type,
+                    },
+                    data=body
+                )
             return response.status_code in [200, 201]
         except Exception:
+            logger.warning("Google Drive upload of %s failed", local_path, exc_info=True)
             return False
 
     def download(self, remote_path: str, local_path: Path) -> bool:
         try:
-            import requests
             if not self._access_token:
                 raise ValueError("Not connected to Google Drive")
 
             file_id = remote_path
-            response = requests.get(
+            with self._http().get(
                 f"{self._base_url}/files/{file_id}?alt=media",
-                headers={"Authorization": f"Bearer {self._access_token}"}
-            )
-            if response.status_code == 200:
-                local_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(local_path, "wb") as f:
-                    f.write(response.content)
-                return True
-            return False
+                headers={"Authorization": f"Bearer {self._access_token}"},
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    return False
+                self._save_stream(response, local_path)
+            return True
         except Exception:
+            logger.warning("Google Drive download of %s failed", remote_path, exc_info=True)
             return False
 
     def list_files(self, folder_path: str) -> list[str]:
         try:
-            import requests
             if not self._access_token:
                 raise ValueError("Not connected to Google Drive")
 
-            response = requests.get(
+            response = self._http().get(
                 f"{self._base_url}/files",
                 headers={"Authorization": f"Bearer {self._access_token}"},
                 params={
@@ -236,14 +539,16 @@ class GoogleDriveSync(CloudSync):
                 }
             )
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 return [f["id"] for f in data.get("files", [])]
             return []
         except Exception:
+            logger.warning("Google Drive listing of %s failed", folder_path, exc_info=True)
             return []
 
     def disconnect(self) -> None:
         self._access_token = None
+        self._close_session()
 
 
 def get_cloud_sync_provider(provider_name: str) -> CloudSync:
@@ -256,6 +561,24 @@ def get_cloud_sync_provider(provider_name: str) -> CloudSync:
         raise ValueError(f"Unknown provider: {provider_name}")
 
 
+def _iter_upload_files(root: Path) -> Iterator[Path]:
+    """Yield files under root to upload, skipping hidden dirs and archives."""
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, symlinked directories are not descended into.
+                    if not entry.name.startswith(".") and not entry.is_symlink():
+                        stack.append(entry.path)
+                elif not entry.name.endswith(".zip"):
+                    yield Path(entry.path)
+
+
 def sync_to_cloud(
     product_name: str,
     provider_name: str,
@@ -271,26 +594,45 @@ def sync_to_cloud(
         if not sync.connect(access_token):
             return SyncResult(success=False, message="Failed to connect to cloud provider")
 
+        # "/" and "" both name the root; strip so joins don't produce "//".
+        cloud_folder = cloud_folder.rstrip("/")
         product_dir = get_data_dir(product_name)
-        files_synced = 0
-
-        for root, dirs, files in os.walk(product_dir):
-            dirs[:] = [d for d in dirs if d != ".backups" and not d.startswith(".")]
-            for file in files:
-                if file.endswith(".zip"):
-                    continue
-                local_path = Path(root) / file
-                rel_path = local_path.relative_to(product_dir)
-                remote_path = f"{cloud_folder}/{rel_path}"
-                if sync.upload(local_path, remote_path):
-                    files_synced += 1
+        uploads = [
+            (local_path, f"{cloud_folder}/{local_path.relative_to(product_dir)}")
+            for local_path in _iter_upload_files(product_dir)
+        ]
+
+        # List only the narrowest folder holding every upload. When that is the
+        # account root, look files up one by one rather than walk the account.
+        common = posixpath.commonpath([posixpath.dirname(path) for _, path in uploads]) if uploads else "/"
+        if common.rstrip("/"):
+            remote_hashes = sync.remote_hashes(common)
+
+            def lookup(remote_path: str) -> Optional[str]:
+                return remote_hashes.get(remote_path.lower())
+        else:
+            lookup = sync.remote_hash
+
+        def upload(local_path: Path, remote_path: str) -> bool:
+            # Files whose remote copy already has identical content are not re-sent.
+            remote_hash = lookup(remote_path)
+            if remote_hash is not None and remote_hash == sync.content_hash(local_path):
+                return True
+            return sync.upload(local_path, remote_path)
+
+        with ThreadPoolExecutor(max_workers=_TRANSFER_WORKERS) as executor:
+            results = executor.map(lambda pair: upload(*pair), uploads)
+            files_synced = sum(1 for uploaded in results if uploaded)
 
-        sync.disconnect()
         return SyncResult(success=True, message=f"Synced {files_synced} files", files_synced=files_synced)
 
     except Exception as e:
         return SyncResult(success=False, message=str(e))
 
+    finally:
+        # Also on failure, so the pooled session's sockets are released.
+        sync.disconnect()
+
 
 def restore_from_cloud(
     product_name: str,
@@ -307,20 +649,24 @@ def restore_from_cloud(
         if not sync.connect(access_token):
             return SyncResult(success=False, message="Failed to connect to cloud provider")
 
-        files_synced = 0
         product_dir = ensure_data_dir(product_name)
-        remote_files = sync.list_files(cloud_folder)
+        downloads = []
 
-        for remote_path in remote_files:
+        for remote_path in sync.list_files(cloud_folder):
             filename = remote_path.split("/")[-1]
             if filename.endswith(".zip"):
                 continue
-            local_path = product_dir / filename
-            if sync.download(remote_path, local_path):
-                files_synced += 1
+            downloads.append((remote_path, product_dir / filename))
+
+        with ThreadPoolExecutor(max_workers=_TRANSFER_WORKERS) as executor:
+            results = executor.map(lambda pair: sync.download(*pair), downloads)
+            files_synced = sum(1 for downloaded in results if downloaded)
 
-        sync.disconnect()
         return SyncResult(success=True, message=f"Restored {files_synced} files", files_synced=files_synced)
 
     except Exception as e:
         return SyncResult(success=False, message=str(e))
+
+    finally:
+        # Also on failure, so the pooled session's sockets are released.
+        sync.disconnect()
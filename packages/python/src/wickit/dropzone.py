@@ -24,6 +24,7 @@ Functions:
     create_sync_folder: Create sync folder configuration.
 """
 
+import os
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -58,72 +59,89 @@ class SyncStatus:
     last_sync: Optional[str]
 
 
-def get_dropbox_folder() -> Optional[Path]:
-    """Find Dropbox sync folder."""
-    home = Path.home()
-    candidates = [
-        home / "Dropbox",
-        home / "Documents" / "Dropbox",
-        home / "Library" / "CloudStorage" / "Dropbox",
-    ]
-    for path in candidates:
-        if path.exists() and (path / "Dropbox").exists():
+# Candidate folders per provider, relative to the home directory, in priority order
+_CLOUD_SPECS: tuple[tuple[CloudProvider, tuple[tuple[str, ...], ...]], ...] = (
+    (CloudProvider.DROPBOX, (
+        ("Dropbox",),
+        ("Documents", "Dropbox"),
+        ("Library", "CloudStorage", "Dropbox"),
+    )),
+    (CloudProvider.GOOGLE_DRIVE, (
+        ("Google Drive",),
+        ("My Drive",),
+        ("Library", "CloudStorage", "GoogleDrive"),
+    )),
+    (CloudProvider.ONEDRIVE, (
+        ("OneDrive",),
+        ("Library", "CloudStorage", "OneDrive"),
+    )),
+    (CloudProvider.ICLOUD, (
+        ("Library", "Mobile Documents", "com~apple~CloudDocs"),
+    )),
+)
+_CLOUD_CANDIDATES = dict(_CLOUD_SPECS)
+
+
+def _list_home(home: Path) -> frozenset[str]:
+    """Names of the entries directly inside the home directory."""
+    try:
+        with os.scandir(home) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _find_cloud_folder(
+    provider: CloudProvider, home: Path, home_entries: Optional[frozenset[str]] = None
+) -> Optional[Path]:
+    """Find a provider's sync folder.
+
+    When ``home_entries`` (from one scan of the home directory) is given,
+    candidates whose first component is missing are skipped without a stat,
+    and top-level candidates need no further check.
+    """
+    for parts in _CLOUD_CANDIDATES[provider]:
+        path = home.joinpath(*parts)
+        if home_entries is None:
+            found = path.exists()
+        else:
+            found = parts[0] in home_entries and (len(parts) == 1 or path.exists())
+        if not found:
+            continue
+        if provider is CloudProvider.DROPBOX and (path / "Dropbox").exists():
             return path / "Dropbox"
-        if path.exists():
-            return path
+        return path
     return None
 
 
+def get_dropbox_folder() -> Optional[Path]:
+    """Find Dropbox sync folder."""
+    return _find_cloud_folder(CloudProvider.DROPBOX, Path.home())
+
+
 def get_google_drive_folder() -> Optional[Path]:
     """Find Google Drive sync folder."""
-    home = Path.home()
-    candidates = [
-        home / "Google Drive",
-        home / "My Drive",
-        home / "Library" / "CloudStorage" / "GoogleDrive",
-    ]
-    for path in candidates:
-        if path.exists():
-            return path
-    return None
+    return _find_cloud_folder(CloudProvider.GOOGLE_DRIVE, Path.home())
 
 
 def get_onedrive_folder() -> Optional[Path]:
     """Find OneDrive sync folder."""
-    home = Path.home()
-    candidates = [
-        home / "OneDrive",
-        home / "Library" / "CloudStorage" / "OneDrive",
-    ]
-    for path in candidates:
-        if path.exists():
-            return path
-    return None
+    return _find_cloud_folder(CloudProvider.ONEDRIVE, Path.home())
 
 
 def get_icloud_folder() -> Optional[Path]:
     """Find iCloud Drive sync folder."""
-    home = Path.home()
-    candidates = [
-        home / "Library" / "Mobile Documents" / "com~apple~CloudDocs",
-    ]
-    for path in candidates:
-        if path.exists():
-            return path
-    return None
+    return _find_cloud_folder(CloudProvider.ICLOUD, Path.home())
 
 
 def detect_cloud_folders() -> list[SyncFolder]:
     """Detect all available cloud sync folders."""
+    home = Path.home()
+    home_entries = _list_home(home)
     folders = []
-    if dropbox := get_dropbox_folder():
-        folders.append(SyncFolder(CloudProvider.DROPBOX, dropbox, True, None))
-    if gdrive := get_google_drive_folder():
-        folders.append(SyncFolder(CloudProvider.GOOGLE_DRIVE, gdrive, True, None))
-    if onedrive := get_onedrive_folder():
-        folders.append(SyncFolder(CloudProvider.ONEDRIVE, onedrive, True, None))
-    if icloud := get_icloud_folder():
-        folders.append(SyncFolder(CloudProvider.ICLOUD, icloud, True, None))
+    for provider, _ in _CLOUD_SPECS:
+        if folder := _find_cloud_folder(provider, home, home_entries):
+            folders.append(SyncFolder(provider, folder, True, None))
     return folders
 
 
@@ -22,19 +22,49 @@ Functions:
     get_all_product_data_dirs: Get paths for all installed products.
 """
 
+import os
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Final
 
 
-VALID_PRODUCTS = {
+VALID_PRODUCTS: Final[Mapping[str, str]] = MappingProxyType({
     "cv-studio": "cvstudio",
     "cvstudio": "cvstudio",
     "aixam": "aixam",
     "studya": "studya",
     "jobforge": "jobforge",
     "default": "default",
-}
+})
 
+# Lookup table keyed on casefolded names so mixed-case input matches directly.
+_VALID_PRODUCTS_CF: Final[Mapping[str, str]] = MappingProxyType(
+    {name.casefold(): dir_name for name, dir_name in VALID_PRODUCTS.items()}
+)
 
+# Hidden directory names derived once from VALID_PRODUCTS.
+_PROJECT_DIRNAMES: Final[frozenset[str]] = frozenset(f".{name}" for name in VALID_PRODUCTS)
+_PRODUCT_DIRNAMES: Final[Mapping[str, str]] = MappingProxyType(
+    {name: f".{dir_name}" for name, dir_name in VALID_PRODUCTS.items()}
+)
+
+
+@lru_cache(maxsize=1)
+def _home() -> Path:
+    """Resolve the user's home directory once per process."""
+    return Path.home()
+
+
+def _clear_caches() -> None:
+    """Forget the cached home directory and every path derived from it."""
+    _home.cache_clear()
+    get_data_dir.cache_clear()
+    get_config_path.cache_clear()
+
+
+@lru_cache(maxsize=32)
 def get_data_dir(product_name: str) -> Path:
     """Get data directory for a product.
 
@@ -44,10 +74,15 @@ def get_data_dir(product_name: str) -> Path:
     Returns:
         Path to the data directory (e.g., ~/.studya/, ~/.jobforge/)
     """
-    dir_name = VALID_PRODUCTS.get(product_name.lower(), product_name.lower())
-    return Path.home() / f".{dir_name}"
+    dir_name = _VALID_PRODUCTS_CF.get(product_name.casefold())
+    if dir_name is None:
+        # Unknown products keep their lower-cased name so existing
+        # directories (e.g. ~/.straße) are not renamed by casefolding.
+        dir_name = product_name.lower()
+    return _home() / f".{dir_name}"
 
 
+@lru_cache(maxsize=32)
 def get_config_path(product_name: str) -> Path:
     """Get config file path for a product.
 
@@ -76,21 +111,31 @@ def ensure_data_dir(product_name: str) -> Path:
 
 def get_project_names() -> list[str]:
     """List all known projects that have data directories."""
-    home = Path.home()
     projects = []
-    for path in home.iterdir():
-        if path.name.startswith(".") and path.is_dir():
-            product = path.name[1:]
-            if product in VALID_PRODUCTS:
-                projects.append(product)
+    with os.scandir(_home()) as entries:
+        for entry in entries:
+            # DirEntry.is_dir() uses the d_type from readdir, avoiding a stat per entry
+            if entry.name in _PROJECT_DIRNAMES and entry.is_dir():
+                projects.append(entry.name[1:])
     return sorted(projects)
 
 
 def is_product_installed(product_name: str) -> bool:
     """Check if a product has a data directory."""
-    return get_data_dir(product_name).exists()
+    # Only existence matters here, so skip following the final symlink
+    return os.path.lexists(get_data_dir(product_name))
 
 
 def get_all_product_data_dirs() -> dict[str, Path]:
     """Get all product data directories."""
-    return {name: get_data_dir(name) for name in VALID_PRODUCTS if is_product_installed(name)}
+    home = _home()
+    try:
+        with os.scandir(home) as entries:
+            present = {entry.name for entry in entries}
+    except OSError:
+        return {}
+    return {
+        name: home / dir_name
+        for name, dir_name in _PRODUCT_DIRNAMES.items()
+        if dir_name in present
+    }
@@ -24,6 +24,7 @@ Functions:
 """
 
 import json
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
@@ -60,17 +61,42 @@ class Config:
     ai: AIConfig = field(default_factory=AIConfig)
 
 
-def get_config(product_name: str) -> Config:
-    """Load configuration for a product."""
-    config_path = get_config_path(product_name)
+# Parsed config files keyed by path, reused until the file's stat stamp changes
+_config_cache: dict[Path, tuple[tuple[int, int, int, int], dict[str, Any]]] = {}
 
-    if not config_path.exists():
-        return Config(project=product_name)
+# A parse is only cached once the file's mtime is older than this, so a
+# same-size rewrite within one timestamp tick of a coarse filesystem is seen.
+_RACY_MTIME_NS = 2 * 10**9
 
+
+def _load_config_data(config_path: Path) -> Optional[dict[str, Any]]:
+    """Read and parse a config file, reusing the previous parse if unchanged."""
     try:
-        with open(config_path) as f:
-            data = json.load(f)
+        stat = config_path.stat()
+    except OSError:
+        return None
+
+    key = (stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, stat.st_ino)
+    cached = _config_cache.get(config_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    try:
+        data = json.loads(config_path.read_bytes())
     except (json.JSONDecodeError, IOError):
+        return None
+
+    if time.time_ns() - stat.st_mtime_ns > _RACY_MTIME_NS:
+        _config_cache[config_path] = (key, data)
+    else:
+        _config_cache.pop(config_path, None)
+    return data
+
+
+def get_config(product_name: str) -> Config:
+    """Load configuration for a product."""
+    data = _load_config_data(get_config_path(product_name))
+    if data is None:
         return Config(project=product_name)
 
     config = Config(
@@ -127,6 +153,7 @@ def save_config(product_name: str, config: Config) -> None:
 
     with open(config_path, "w") as f:
         json.dump(data, f, indent=2)
+    _config_cache.pop(config_path, None)
 
 
 def get_sync_provider(product_name: str) -> str:
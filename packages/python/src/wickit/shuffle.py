@@ -22,6 +22,13 @@ from datetime import datetime
 from dataclasses import dataclass, asdict
 import asyncio
 import threading
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _local_ip() -> str:
+    """Resolve this host's IP address once per process (DNS lookups can block)"""
+    return socket.gethostbyname(socket.gethostname())
 
 
 class ShuffleError(Exception):
@@ -94,6 +101,8 @@ class ServiceRegistry:
         self.service_info: Optional[ServiceInfo] = None
         self._zeroconf = None
         self._service_info = None
+        self._health_base: Tuple[Tuple[str, Any], ...] = ()
+        self._start_monotonic = 0.0
 
     def start(self, preferred_port: Optional[int] = None) -> ServiceInfo:
         """
@@ -125,6 +134,22 @@ class ServiceRegistry:
             start_time=datetime.now(),
             status="healthy"
         )
+        self._start_monotonic = time.monotonic()
+
+        # Fields that never change after start; status and uptime are filled per call
+        info = self.service_info
+        self._health_base = (
+            ("service", info.service_id),
+            ("status", info.status),
+            ("port", info.port),
+            ("instance_id", info.instance_id),
+            ("pid", info.pid),
+            ("verification_token", info.verification_token),
+            ("project_context", info.project_context),
+            ("mdns", self.mdns_name),
+            ("uptime_seconds", 0.0),
+            ("start_time", info.start_time.isoformat()),
+        )
 
         # Register mDNS if name provided
         if self.mdns_name:
@@ -136,8 +161,15 @@ class ServiceRegistry:
         """Find an available port within the specified range."""
         min_port, max_port = self.port_range
 
-        for port in range(min_port, max_port + 1):
-            if self._is_port_available(port):
+        # One socket serves every probe: a failed bind leaves it unbound and
+        # reusable, so there is no socket()/close() pair per candidate port.
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            for port in range(min_port, max_port + 1):
+                try:
+                    sock.bind(('127.0.0.1', port))
+                except OSError:
+                    continue
                 return port
 
         raise NoAvailablePortError(
@@ -146,26 +178,23 @@ class ServiceRegistry:
 
     def _is_port_available(self, port: int) -> bool:
         """Check if a specific port is available"""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            sock.bind(('127.0.0.1', port))
-            sock.close()
-            return True
-        except OSError:
-            return False
+            try:
+                sock.bind(('127.0.0.1', port))
+            except OSError:
+                return False
+        return True
 
     def _register_mdns(self):
         """Register mDNS service (requires zeroconf)"""
         try:
             from zeroconf import Zeroconf, ServiceInfo
-            import socket as sock
 
             zeroconf = Zeroconf()
 
             # Get local IP
-            hostname = sock.gethostname()
-            local_ip = sock.gethostbyname(hostname)
+            local_ip = _local_ip()
 
             # Create service info
             service_type = "_http._tcp.local."
@@ -174,7 +203,7 @@ class ServiceRegistry:
             info = ServiceInfo(
                 service_type,
                 service_name,
-                addresses=[sock.inet_aton(local_ip)],
+                addresses=[socket.inet_aton(local_ip)],
                 port=self.service_info.port,
                 properties={
                     'service_id': self.service_info.service_id,
@@ -206,20 +235,10 @@ class ServiceRegistry:
         if not self.service_info:
             return {"error": "Service not started"}
 
-        uptime_seconds = (datetime.now() - self.service_info.start_time).total_seconds()
-
-        return {
-            "service": self.service_info.service_id,
-            "status": self.service_info.status,
-            "port": self.service_info.port,
-            "instance_id": self.service_info.instance_id,
-            "pid": self.service_info.pid,
-            "verification_token": self.service_info.verification_token,
-            "project_context": self.service_info.project_context,
-            "mdns": self.mdns_name,
-            "uptime_seconds": uptime_seconds,
-            "start_time": self.service_info.start_time.isoformat()
-        }
+        response = dict(self._health_base)
+        response["status"] = self.service_info.status
+        response["uptime_seconds"] = time.monotonic() - self._start_monotonic
+        return response
 
     def stop(self):
         """Cleanup: unregister mDNS service"""
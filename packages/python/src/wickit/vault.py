@@ -19,9 +19,14 @@ Functions:
 
 import sqlite3
 import json
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Any, Set, Tuple, Union
+from collections import namedtuple
 from contextlib import contextmanager
+from functools import lru_cache
 
 from .hideaway import get_data_dir
 
@@ -31,6 +36,61 @@ class DatabaseError(Exception):
     pass
 
 
+# Directories already created by a SQLiteDatabase in this process
+_ENSURED_DIRS: Set[Path] = set()
+
+# Retries for "database is locked" while another connection holds the write lock
+_LOCK_RETRIES = 5
+_LOCK_RETRY_DELAY = 0.05
+
+_ROW_FACTORIES = ("dict", "namedtuple", "tuple")
+_FETCH_SIZE = 1000
+
+
+@lru_cache(maxsize=128)
+def _row_class(columns: Tuple[str, ...]) -> type:
+    """Get the namedtuple class for a result column set."""
+    return namedtuple("Row", columns, rename=True)
+
+
+def _retry_locked(func: Callable[..., Any], *args: Any) -> Any:
+    """Call ``func``, retrying with exponential backoff while the database is locked."""
+    delay = _LOCK_RETRY_DELAY
+    for attempt in range(_LOCK_RETRIES):
+        try:
+            return func(*args)
+        except sqlite3.OperationalError as e:
+            if "locked" not in str(e) or attempt == _LOCK_RETRIES - 1:
+                raise
+            time.sleep(delay)
+            delay *= 2
+
+
+class _Prepared:
+    """Pre-built statement bound to a database, reused across rows."""
+    
+    def __init__(self, db: "SQLiteDatabase", sql: str):
+        self.db = db
+        self.sql = sql
+    
+    def run(self, values: Tuple) -> int:
+        """Execute the statement with one row of values."""
+        return self.db.execute_command(self.sql, values)
+    
+    def run_many(self, rows: List[Tuple]) -> int:
+        """Execute the statement for every row of values."""
+        return self.db.execute_many(self.sql, rows)
+
+
+class _ThreadConnection:
+    """Holds one thread's connection; it is closed once the holder is dropped."""
+    
+    __slots__ = ("conn", "__weakref__")
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
 class SQLiteDatabase:
     """Generic SQLite database wrapper with helper methods."""
     
@@ -38,79 +98,147 @@ class SQLiteDatabase:
         self.product_name = product_name
         self.db_name = db_name
         self.db_path = get_data_dir(product_name) / db_name
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        parent = self.db_path.parent
+        if parent not in _ENSURED_DIRS:
+            parent.mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(parent)
+        self._local = threading.local()
+        self._connections: Set[sqlite3.Connection] = set()
+        # Reentrant: dropping thread-locals under the lock runs _release.
+        self._connections_lock = threading.RLock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode; transactions are explicit."""
+        conn = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        conn.execute("PRAGMA foreign_keys = ON")
+        # Only takes effect on a new database (or after vacuum_full)
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("PRAGMA journal_mode = WAL")  # Readers don't block the writer
+        return conn
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use.
+        
+        The connection is closed when its thread ends and the thread's
+        locals are released, so short-lived workers don't leak handles.
+        """
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = self._connect()
+            holder = _ThreadConnection(conn)
+            weakref.finalize(holder, self._release, conn)
+            with self._connections_lock:
+                self._connections.add(conn)
+            self._local.holder = holder
+        return holder.conn
+    
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """Forget and close a connection whose thread has gone away."""
+        with self._connections_lock:
+            self._connections.discard(conn)
+        conn.close()
     
     @contextmanager
     def get_connection(self):
-        """Get database connection with proper error handling."""
-        conn = None
+        """Get this thread's persistent connection with proper error handling.
+        
+        Statements autocommit unless issued inside ``transaction()``, which
+        is responsible for rolling back on failure.
+        """
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row  # Enable column access by name
-            conn.execute("PRAGMA foreign_keys = ON")
-            yield conn
+            yield self._connection()
         except sqlite3.Error as e:
-            if conn:
-                conn.rollback()
             raise DatabaseError(f"Database error: {e}")
-        finally:
-            if conn:
-                conn.close()
     
-    def execute_query(self, query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
-        """Execute a SELECT query and return results."""
+    def close(self):
+        """Close every thread's connection; each is reopened on next use."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, set()
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+    
+    def execute_query(self, query: str, params: Tuple = (),
+                      row_factory: str = "dict") -> List[Any]:
+        """Execute a SELECT query and return results.
+        
+        ``row_factory`` selects the row type: ``"dict"`` (default),
+        ``"namedtuple"`` (a class cached per column set) or ``"tuple"``.
+        """
+        if row_factory not in _ROW_FACTORIES:
+            raise ValueError(f"Unknown row_factory: {row_factory}")
+        
         with self.get_connection() as conn:
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Convert plain tuples in bulk below
+            _retry_locked(cursor.execute, query, params)
+            if cursor.description is None:
+                return []
+            columns = tuple(d[0] for d in cursor.description)
+            make_row = _row_class(columns)._make if row_factory == "namedtuple" else None
+            
+            results: List[Any] = []
+            while True:
+                batch = cursor.fetchmany(_FETCH_SIZE)
+                if not batch:
+                    break
+                if row_factory == "tuple":
+                    results.extend(batch)
+                elif make_row is not None:
+                    results.extend(map(make_row, batch))
+                else:
+                    results.extend([dict(zip(columns, row)) for row in batch])
+            return results
     
     def execute_command(self, command: str, params: Tuple = ()) -> int:
         """Execute an INSERT/UPDATE/DELETE command and return affected rows."""
         with self.get_connection() as conn:
-            cursor = conn.execute(command, params)
-            conn.commit()
+            cursor = _retry_locked(conn.execute, command, params)
             return cursor.rowcount
     
     def execute_many(self, command: str, params_list: List[Tuple]) -> int:
-        """Execute a command with multiple parameter sets."""
-        with self.get_connection() as conn:
-            cursor = conn.executemany(command, params_list)
-            conn.commit()
+        """Execute a command with multiple parameter sets in one transaction."""
+        with self.transaction(), self.get_connection() as conn:
+            cursor = _retry_locked(conn.executemany, command, params_list)
             return cursor.rowcount
     
     def create_table(self, table_name: str, columns: Dict[str, str], 
                    constraints: Optional[List[str]] = None) -> bool:
-        """Create a table with specified columns and constraints."""
-        if constraints is None:
-            constraints = []
-        
-        columns_def = ", ".join([f"{name} {dtype}" for name, dtype in columns.items()])
-        constraints_str = ", ".join(constraints) if constraints else ""
+        """Create a table with specified columns and constraints.
         
-        query = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_def}"
-        if constraints_str:
-            query += f", {constraints_str}"
-        query += ")"
+        Each call commits on its own, on the calling thread's shared
+        connection. When bootstrapping several tables with seed data, prefer
+        ``bulk_setup`` so that DDL, inserts and index creation share a single
+        transaction, with indexes built after the rows are loaded.
+        """
+        definitions = [f"{name} {dtype}" for name, dtype in columns.items()]
+        if constraints:
+            definitions.extend(constraints)
         
+        query = "".join(("CREATE TABLE IF NOT EXISTS ", table_name, " (", ", ".join(definitions), ")"))
         self.execute_command(query)
         return True
     
     def insert(self, table: str, data: Dict[str, Any]) -> int:
         """Insert data into a table."""
-        columns = list(data.keys())
-        placeholders = ", ".join(["?" for _ in columns])
-        values = tuple(data.values())
+        return self.prepare_insert(table, data.keys()).run(tuple(data.values()))
+    
+    def prepare_insert(self, table: str, columns: Iterable[str]) -> _Prepared:
+        """Prepare an INSERT for a fixed column order.
         
+        The SQL is built once; call ``.run(values)`` or ``.run_many(rows)``
+        with tuples in the same order as ``columns``.
+        """
+        columns = tuple(columns)
+        placeholders = ", ".join("?" * len(columns))
         query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
-        return self.execute_command(query, values)
+        return _Prepared(self, query)
     
     def select(self, table: str, columns: str = "*", 
               where: Optional[str] = None, params: Tuple = ()) -> List[Dict[str, Any]]:
         """Select data from a table."""
-        query = f"SELECT {columns} FROM {table}"
-        if where:
-            query += f" WHERE {where}"
-        
+        query = "".join(("SELECT ", columns, " FROM ", table, " WHERE " if where else "", where or ""))
         return self.execute_query(query, params)
     
     def update(self, table: str, data: Dict[str, Any], 
@@ -138,6 +266,23 @@ class SQLiteDatabase:
         self.execute_command(query)
         return True
     
+    def bulk_setup(self, ddl: List[str], indices: Optional[List[str]] = None,
+                  inserts: Optional[List[Tuple[str, List[Tuple]]]] = None) -> bool:
+        """Run schema DDL, seed inserts and index creation in one transaction.
+        
+        Statements run in order: ``ddl``, then each ``(command, params_list)``
+        pair in ``inserts`` via ``executemany``, then ``indices`` last so the
+        indexes are built once over the loaded rows.
+        """
+        with self.transaction(), self.get_connection() as conn:
+            for statement in ddl:
+                conn.execute(statement)
+            for command, params_list in inserts or []:
+                conn.executemany(command, params_list)
+            for statement in indices or []:
+                conn.execute(statement)
+        return True
+    
     def get_table_info(self, table: str) -> List[Dict[str, str]]:
         """Get information about table columns."""
         query = f"PRAGMA table_info({table})"
@@ -148,21 +293,37 @@ class SQLiteDatabase:
         query = "SELECT name FROM sqlite_master WHERE type='table'"
         return [row['name'] for row in self.execute_query(query)]
     
+    @property
+    def in_transaction(self) -> bool:
+        """Whether a transaction is currently open on the connection."""
+        holder = getattr(self._local, "holder", None)
+        return holder is not None and holder.conn.in_transaction
+    
     def begin_transaction(self):
         """Begin a database transaction."""
-        self.execute_command("BEGIN TRANSACTION")
+        with self.get_connection() as conn:
+            _retry_locked(conn.execute, "BEGIN")
     
     def commit(self):
         """Commit the current transaction."""
-        self.execute_command("COMMIT")
+        with self.get_connection() as conn:
+            _retry_locked(conn.execute, "COMMIT")
     
     def rollback(self):
-        """Rollback the current transaction."""
-        self.execute_command("ROLLBACK")
+        """Rollback the current transaction, if one is open."""
+        if self.in_transaction:
+            with self.get_connection() as conn:
+                conn.execute("ROLLBACK")
     
     @contextmanager
     def transaction(self):
-        """Context manager for database transactions."""
+        """Context manager for database transactions.
+        
+        Nested use joins the enclosing transaction instead of opening a new one.
+        """
+        if self.in_transaction:
+            yield self
+            return
         try:
             self.begin_transaction()
             yield self
@@ -171,29 +332,54 @@ class SQLiteDatabase:
             self.rollback()
             raise
     
-    def vacuum(self) -> bool:
-        """Optimize the database."""
+    def vacuum(self, pages: int = 1000) -> bool:
+        """Reclaim up to ``pages`` free pages without rewriting the database."""
+        if self.in_transaction:
+            raise DatabaseError("vacuum() cannot run inside a transaction")
+        
+        with self.get_connection() as conn:
+            # execute() only steps the pragma once (one page); executescript runs it to completion
+            _retry_locked(conn.executescript, f"PRAGMA incremental_vacuum({int(pages)})")
+        return True
+    
+    def vacuum_full(self) -> bool:
+        """Rebuild the whole database file, locking it for the duration.
+        
+        Also switches databases created before incremental auto-vacuum over
+        to it.
+        """
         self.execute_command("VACUUM")
         return True
     
-    def backup(self, backup_path: Union[str, Path]) -> bool:
-        """Create a backup of the database."""
-        with self.get_connection() as conn:
-            conn.backup(str(backup_path))
+    def backup(self, backup_path: Union[str, Path], pages: int = 100, sleep: float = 0.05,
+               progress: Optional[Callable[[int, int, int], None]] = None) -> bool:
+        """Create a backup of the database.
+        
+        Pages are copied ``pages`` at a time from the open connection, pausing
+        ``sleep`` seconds between steps so writers are not blocked for the
+        whole copy. ``progress(status, remaining, total)`` is called after each
+        step. Pass ``pages=-1`` to copy everything in a single step.
+        """
+        target = sqlite3.connect(str(backup_path))
+        try:
+            with self.get_connection() as conn:
+                conn.backup(target, pages=pages, progress=progress, sleep=sleep)
+        finally:
+            target.close()
         return True
     
     def restore(self, backup_path: Union[str, Path]) -> bool:
-        """Restore database from backup."""
+        """Restore database from backup into the open connection."""
+        backup_path = Path(backup_path)
         if not backup_path.exists():
             raise DatabaseError(f"Backup file not found: {backup_path}")
         
-        # Close current connection and restore
-        self.execute_command("PRAGMA read_uncommitted = ON")
-        self.backup(self.db_path)  # Backup current before restore
-        
-        # Copy backup to database location
-        import shutil
-        shutil.copy2(backup_path, self.db_path)
+        source = sqlite3.connect(str(backup_path))
+        try:
+            with self.get_connection() as conn:
+                source.backup(conn)
+        finally:
+            source.close()
         return True
 
 
@@ -214,11 +400,25 @@ class Transaction:
             self.db.commit()
 
 
-def get_database(product_name: str, db_name: str = "database.db") -> SQLiteDatabase:
-    """Get a database instance for a product."""
+@lru_cache(maxsize=None)
+def _get_database(product_name: str, db_name: str) -> SQLiteDatabase:
+    """Create the instance get_database() caches for a (product, file) pair."""
     return SQLiteDatabase(product_name, db_name)
 
 
+def get_database(product_name: str, db_name: str = "database.db") -> SQLiteDatabase:
+    """Get the shared database instance for a product.
+    
+    Instances are cached per ``(product_name, db_name)`` so callers reuse one
+    connection; use ``get_database.cache_clear()`` to drop them (e.g. in tests).
+    """
+    # Cache on positional arguments so every call spelling shares one instance.
+    return _get_database(product_name, db_name)
+
+
+get_database.cache_clear = _get_database.cache_clear  # type: ignore[attr-defined]
+
+
 def init_database(product_name: str, db_name: str = "database.db") -> SQLiteDatabase:
     """Initialize database for a product."""
     return SQLiteDatabase(product_name, db_name)
@@ -0,0 +1,132 @@
+"""Shared fixtures for wickit tests."""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+import wickit  # noqa: F401  # import once per worker before collection
+import wickit.alter_egos
+from wickit.hideaway import _clear_caches
+
+# Metadata of the populated tree's "myprofile", serialized once at import.
+_META_CUSTOM = json.dumps({
+    "name": "My Custom Profile",
+    "created": "2024-01-01T00:00:00",
+    "modified": "2024-01-02T00:00:00",
+})
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="Skip tests marked 'filesystem' or 'redundant'.",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "filesystem: test touches the real filesystem (deselected by --fast)"
+    )
+    config.addinivalue_line(
+        "markers", "redundant: coverage overlaps another test (deselected by --fast)"
+    )
+
+    # Put tmp_path on a RAM-backed filesystem when one is available, unless
+    # --basetemp was given. xdist workers inherit the controller's basetemp.
+    if config.option.basetemp is not None or hasattr(config, "workerinput"):
+        return
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        config._wickit_basetemp = tempfile.mkdtemp(dir="/dev/shm", prefix="pytest-")
+        config.option.basetemp = config._wickit_basetemp
+
+
+def pytest_unconfigure(config):
+    basetemp = getattr(config, "_wickit_basetemp", None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark tests using real temporary directories and apply --fast."""
+    for item in items:
+        if {"tmp_path", "tmp_path_factory"}.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.filesystem)
+
+    if not config.getoption("--fast"):
+        return
+
+    def skipped(item):
+        return item.get_closest_marker("filesystem") or item.get_closest_marker("redundant")
+
+    selected = [item for item in items if not skipped(item)]
+    deselected = [item for item in items if skipped(item)]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(autouse=True)
+def _clear_home_cache():
+    """Drop hideaway's cached home and data paths around every test."""
+    _clear_caches()
+    yield
+    _clear_caches()
+
+
+@pytest.fixture
+def fake_home(tmp_path, monkeypatch):
+    """Point Path.home() at a temporary directory."""
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: tmp_path))
+    _clear_caches()
+    return tmp_path
+
+
+@pytest.fixture
+def fs_home(fs, monkeypatch):
+    """Point Path.home() at an empty directory on a pyfakefs filesystem."""
+    home = Path("/h")
+    fs.create_dir(home)
+    # With pyfakefs active, Path is a wrapper forwarding to its fake Path
+    # class; patch that class, which is the one Path.home is bound to.
+    monkeypatch.setattr(Path.home.__self__, "home", classmethod(lambda cls: home))
+    _clear_caches()
+    return home
+
+
+@pytest.fixture
+def fake_data_dir(fs):
+    """Empty product data directory on a pyfakefs filesystem."""
+    return Path(fs.create_dir("/d/.testproduct").path)
+
+
+@pytest.fixture(scope="module")
+def populated_data_dir(tmp_path_factory):
+    """Product data directory with a fixed set of profiles, shared per module.
+
+    Tests using it must not modify it. profile1 is marked default and
+    myprofile has a metadata file; .hidden and notadir.txt are not profiles.
+    """
+    data_dir = tmp_path_factory.mktemp("prof") / ".testproduct"
+    for name in ("alpha", "beta", "zebra", "profile1", "profile2", "myprofile", ".hidden"):
+        os.makedirs(os.path.join(data_dir, name))
+    open(data_dir / "profile1" / ".default", "wb").close()
+    (data_dir / "notadir.txt").write_text("not a dir")
+    (data_dir / "myprofile" / ".testproduct.json").write_text(_META_CUSTOM)
+    return data_dir
+
+
+@pytest.fixture
+def set_data_dir(monkeypatch):
+    """Return a function that points alter_egos at a given data directory."""
+
+    def apply(path):
+        monkeypatch.setattr(wickit.alter_egos, "get_data_dir", lambda *_args, **_kwargs: path)
+
+    return apply
@@ -1,23 +1,55 @@
 """Tests for omni-kit - Profile management."""
 
 import json
+import os
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
+from wickit import (
+    Profile,
+    copy_profile,
+    create_profile,
+    delete_profile,
+    get_default_profile,
+    list_profiles,
+    profile_exists,
+    set_default_profile,
+)
+
+# Metadata of the copy_profile source, serialized once at import.
+_META_SRC = json.dumps({"name": "Source", "created": "2024-01-01", "modified": "2024-01-01"})
+
+
+def _build_tree(root, spec):
+    """Create directories and files under root.
+
+    spec maps relative paths to None for a directory, or to str or bytes
+    for a file's contents. Each parent directory is created once.
+    """
+    root = os.fspath(root)
+    dirs = {rel for rel, contents in spec.items() if contents is None}
+    dirs.update(os.path.dirname(rel) for rel, contents in spec.items() if contents is not None)
+    for rel in dirs:
+        os.makedirs(os.path.join(root, rel), exist_ok=True)
+    for rel, contents in spec.items():
+        if contents is not None:
+            if isinstance(contents, str):
+                contents = contents.encode()
+            with open(os.path.join(root, rel), "wb") as f:
+                f.write(contents)
+
 
 class TestProfile:
     """Tests for Profile dataclass."""
 
     def test_profile_creation(self):
         """Test Profile can be created with all fields."""
-        from wickit import Profile
-
+        path = Path("/test/path")
         profile = Profile(
             id="test-profile",
             name="Test Profile",
-            path=Path("/test/path"),
+            path=path,
             is_default=True,
             created="2024-01-01T00:00:00",
             modified="2024-01-02T00:00:00"
@@ -25,15 +57,13 @@ class TestProfile:
 
         assert profile.id == "test-profile"
         assert profile.name == "Test Profile"
-        assert profile.path == Path("/test/path")
+        assert profile.path == path
         assert profile.is_default is True
         assert profile.created == "2024-01-01T00:00:00"
         assert profile.modified == "2024-01-02T00:00:00"
 
     def test_profile_defaults(self):
         """Test Profile with default values."""
-        from wickit import Profile
-
         profile = Profile(
             id="test",
             name="Test",
@@ -50,452 +80,309 @@ class TestProfile:
 class TestListProfiles:
     """Tests for list_profiles function."""
 
-    def test_list_profiles_empty(self, tmp_path):
+    def test_list_profiles_empty(self, fake_data_dir, set_data_dir):
         """Test list_profiles returns empty list when no profiles exist."""
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = tmp_path
+        set_data_dir(fake_data_dir)
 
-            from wickit import list_profiles
+        result = list_profiles("testproduct")
+        assert result == []
 
-            result = list_profiles("testproduct")
-            assert result == []
-
-    def test_list_profiles_finds_profiles(self, tmp_path):
+    def test_list_profiles_finds_profiles(self, populated_data_dir, set_data_dir):
         """Test list_profiles finds profile directories."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-        (data_dir / "profile1").mkdir()
-        (data_dir / "profile2").mkdir()
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        set_data_dir(populated_data_dir)
 
-            from wickit import list_profiles
+        result = list_profiles("testproduct")
+        assert len(result) == 6
 
-            result = list_profiles("testproduct")
-            assert len(result) == 2
-
-    def test_list_profiles_ignores_hidden(self, tmp_path):
+    def test_list_profiles_ignores_hidden(self, populated_data_dir, set_data_dir):
         """Test list_profiles ignores hidden directories."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-        (data_dir / "profile1").mkdir()
-        (data_dir / ".hidden").mkdir()
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
-
-            from wickit import list_profiles
+        set_data_dir(populated_data_dir)
 
-            result = list_profiles("testproduct")
-            assert len(result) == 1
-            assert result[0].id == "profile1"
+        result = list_profiles("testproduct")
+        ids = {p.id for p in result}
+        assert ".hidden" not in ids
 
-    def test_list_profiles_sorted(self, tmp_path):
+    def test_list_profiles_sorted(self, populated_data_dir, set_data_dir):
         """Test list_profiles returns sorted list."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-        (data_dir / "zebra").mkdir()
-        (data_dir / "alpha").mkdir()
-        (data_dir / "beta").mkdir()
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
-
-            from wickit import list_profiles
+        set_data_dir(populated_data_dir)
 
-            result = list_profiles("testproduct")
-            names = [p.name for p in result]
-            assert names == sorted(names)
+        result = list_profiles("testproduct")
+        names = [p.name for p in result]
+        assert names == sorted(names)
 
 
 class TestGetDefaultProfile:
     """Tests for get_default_profile function."""
 
-    def test_get_default_profile_exists(self, tmp_path):
+    def test_get_default_profile_exists(self, populated_data_dir, set_data_dir):
         """Test get_default_profile returns default profile."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-        profile1 = data_dir / "profile1"
-        profile1.mkdir()
-        profile2 = data_dir / "profile2"
-        profile2.mkdir()
-        (profile1 / ".default").touch()
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
-
-            from wickit import get_default_profile
+        set_data_dir(populated_data_dir)
 
-            result = get_default_profile("testproduct")
-            assert result is not None
-            assert result.id == "profile1"
+        result = get_default_profile("testproduct")
+        assert result is not None
+        assert result.id == "profile1"
 
-    def test_get_default_profile_fallback(self, tmp_path):
+    def test_get_default_profile_fallback(self, fake_data_dir, set_data_dir):
         """Test get_default_profile returns first profile if no default."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-        (data_dir / "profile1").mkdir()
-        (data_dir / "profile2").mkdir()
+        data_dir = fake_data_dir
+        for name in ("profile1", "profile2"):
+            os.mkdir(os.path.join(data_dir, name))
 
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        set_data_dir(data_dir)
 
-            from wickit import get_default_profile
+        result = get_default_profile("testproduct")
+        assert result is not None
+        assert result.id == "profile1"
 
-            result = get_default_profile("testproduct")
-            assert result is not None
-            assert result.id == "profile1"
-
-    def test_get_default_profile_empty(self, tmp_path):
+    def test_get_default_profile_empty(self, fake_data_dir, set_data_dir):
         """Test get_default_profile returns None when no profiles."""
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = tmp_path
-
-            from wickit import get_default_profile
+        set_data_dir(fake_data_dir)
 
-            result = get_default_profile("testproduct")
-            assert result is None
+        result = get_default_profile("testproduct")
+        assert result is None
 
 
 class TestCreateProfile:
     """Tests for create_profile function."""
 
-    def test_create_profile(self, tmp_path):
+    def test_create_profile(self, fake_data_dir, set_data_dir):
         """Test create_profile creates profile directory."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        data_dir = fake_data_dir
 
-            from wickit import create_profile
+        set_data_dir(data_dir)
 
-            result = create_profile("testproduct", "My Profile")
+        result = create_profile("testproduct", "My Profile")
 
-            assert result.id == "my-profile"
-            assert result.name == "My Profile"
-            assert result.path == data_dir / "my-profile"
-            assert result.is_default is False
-            assert (data_dir / "my-profile").exists()
-            assert (data_dir / "my-profile" / "data").exists()
+        assert result.id == "my-profile"
+        assert result.name == "My Profile"
+        profile_path = data_dir / "my-profile"
+        assert result.path == profile_path
+        assert result.is_default is False
+        assert profile_path.exists()
+        assert (profile_path / "data").exists()
 
-    def test_create_profile_creates_metadata(self, tmp_path):
+    def test_create_profile_creates_metadata(self, fake_data_dir, set_data_dir):
         """Test create_profile creates metadata file."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
+        data_dir = fake_data_dir
 
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        set_data_dir(data_dir)
 
-            from wickit import create_profile
+        result = create_profile("testproduct", "Test Profile")
 
-            result = create_profile("testproduct", "Test Profile")
+        metadata_file = data_dir / "test-profile" / ".testproduct.json"
+        assert metadata_file.exists()
+        metadata = json.loads(metadata_file.read_text())
+        assert metadata["name"] == "Test Profile"
+        assert "created" in metadata
+        assert "modified" in metadata
 
-            metadata_file = data_dir / "test-profile" / ".testproduct.json"
-            assert metadata_file.exists()
-            metadata = json.loads(metadata_file.read_text())
-            assert metadata["name"] == "Test Profile"
-            assert "created" in metadata
-            assert "modified" in metadata
-
-    def test_create_profile_idempotent(self, tmp_path):
+    def test_create_profile_idempotent(self, fake_data_dir, set_data_dir):
         """Test create_profile creates same ID for same name."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        data_dir = fake_data_dir
 
-            from wickit import create_profile
+        set_data_dir(data_dir)
 
-            result1 = create_profile("testproduct", "My Profile")
-            result2 = create_profile("testproduct", "My Profile")
+        result1 = create_profile("testproduct", "My Profile")
+        result2 = create_profile("testproduct", "My Profile")
 
-            assert result1.id == result2.id
+        assert result1.id == result2.id
 
 
 class TestDeleteProfile:
     """Tests for delete_profile function."""
 
-    def test_delete_profile_exists(self, tmp_path):
-        """Test delete_profile removes profile."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
+    @pytest.mark.parametrize("contents", [
+        pytest.param({"profile1": None}, id="empty"),
+        pytest.param({"profile1/data/f": b"x", "profile1/.testproduct.json": _META_SRC}, id="populated"),
+    ])
+    def test_delete_profile_exists(self, fake_data_dir, set_data_dir, contents):
+        """Test delete_profile removes profile and everything in it."""
+        data_dir = fake_data_dir
         profile_dir = data_dir / "profile1"
-        profile_dir.mkdir()
+        _build_tree(data_dir, contents)
 
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        set_data_dir(data_dir)
 
-            from wickit import delete_profile
+        result = delete_profile("testproduct", "profile1")
+        assert result is True
+        assert not profile_dir.exists()
 
-            result = delete_profile("testproduct", "profile1")
-            assert result is True
-            assert not profile_dir.exists()
-
-    def test_delete_profile_not_exists(self, tmp_path):
+    def test_delete_profile_not_exists(self, fake_data_dir, set_data_dir):
         """Test delete_profile returns False when profile doesn't exist."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        data_dir = fake_data_dir
 
-            from wickit import delete_profile
+        set_data_dir(data_dir)
 
-            result = delete_profile("testproduct", "nonexistent")
-            assert result is False
+        result = delete_profile("testproduct", "nonexistent")
+        assert result is False
 
 
 class TestCopyProfile:
     """Tests for copy_profile function."""
 
-    def test_copy_profile(self, tmp_path):
+    def test_copy_profile(self, fake_data_dir, set_data_dir):
         """Test copy_profile creates copy."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-        source = data_dir / "source-profile"
-        source.mkdir()
-        (source / "data").mkdir()
-        (source / "data" / "file.txt").write_text("test")
-        metadata = {"name": "Source", "created": "2024-01-01", "modified": "2024-01-01"}
-        (source / ".testproduct.json").write_text(json.dumps(metadata))
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        data_dir = fake_data_dir
+        _build_tree(data_dir, {
+            "source-profile/data/file.txt": "test",
+            "source-profile/.testproduct.json": _META_SRC,
+        })
 
-            from wickit import copy_profile
+        set_data_dir(data_dir)
 
-            result = copy_profile("testproduct", "source-profile", "Copied Profile")
+        result = copy_profile("testproduct", "source-profile", "Copied Profile")
 
-            assert result is not None
-            assert result.id == "copied-profile"
-            assert result.name == "Copied Profile"
-            assert (data_dir / "copied-profile").exists()
-            assert (data_dir / "copied-profile" / "data" / "file.txt").exists()
+        assert result is not None
+        assert result.id == "copied-profile"
+        assert result.name == "Copied Profile"
+        target = data_dir / "copied-profile"
+        assert target.exists()
+        assert (target / "data" / "file.txt").exists()
 
 
 class TestSetDefaultProfile:
     """Tests for set_default_profile function."""
 
-    def test_set_default_profile(self, tmp_path):
+    def test_set_default_profile(self, fs, fake_data_dir, set_data_dir):
         """Test set_default_profile marks profile as default."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
+        data_dir = fake_data_dir
         profile1 = data_dir / "profile1"
-        profile1.mkdir()
         profile2 = data_dir / "profile2"
         profile2.mkdir()
-        (profile1 / ".default").touch()
+        fs.create_file(profile1 / ".default")
 
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        set_data_dir(data_dir)
 
-            from wickit import set_default_profile
+        result = set_default_profile("testproduct", "profile2")
+        assert result is True
+        assert not (profile1 / ".default").exists()
+        assert (profile2 / ".default").exists()
 
-            result = set_default_profile("testproduct", "profile2")
-            assert result is True
-            assert not (profile1 / ".default").exists()
-            assert (profile2 / ".default").exists()
-
-    def test_set_default_profile_removes_old(self, tmp_path):
+    def test_set_default_profile_removes_old(self, fs, fake_data_dir, set_data_dir):
         """Test set_default_profile removes old default marker."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
+        data_dir = fake_data_dir
         profile1 = data_dir / "profile1"
-        profile1.mkdir()
-        (profile1 / ".default").touch()
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        fs.create_file(profile1 / ".default")
 
-            from wickit import set_default_profile
+        set_data_dir(data_dir)
 
-            set_default_profile("testproduct", "profile1")
-            assert (profile1 / ".default").exists()
+        set_default_profile("testproduct", "profile1")
+        assert (profile1 / ".default").exists()
 
 
 class TestProfileExists:
     """Tests for profile_exists function."""
 
-    def test_profile_exists_true(self, tmp_path):
+    def test_profile_exists_true(self, populated_data_dir, set_data_dir):
         """Test profile_exists returns True when profile exists."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-        (data_dir / "profile1").mkdir()
+        set_data_dir(populated_data_dir)
 
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        result = profile_exists("testproduct", "profile1")
+        assert result is True
 
-            from wickit import profile_exists
-
-            result = profile_exists("testproduct", "profile1")
-            assert result is True
-
-    def test_profile_exists_false(self, tmp_path):
+    def test_profile_exists_false(self, populated_data_dir, set_data_dir):
         """Test profile_exists returns False when profile doesn't exist."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        set_data_dir(populated_data_dir)
 
-            from wickit import profile_exists
-
-            result = profile_exists("testproduct", "nonexistent")
-            assert result is False
+        result = profile_exists("testproduct", "nonexistent")
+        assert result is False
 
 
 class TestProfileEdgeCases:
     """Edge case tests for profile management."""
 
-    def test_create_profile_with_special_characters(self, tmp_path):
+    def test_create_profile_with_special_characters(self, fake_data_dir, set_data_dir):
         """Test create_profile handles special characters in name."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        data_dir = fake_data_dir
 
-            from wickit import create_profile
+        set_data_dir(data_dir)
 
-            result = create_profile("testproduct", "My Profile 123!")
+        result = create_profile("testproduct", "My Profile 123!")
 
-            assert result.id.startswith("my-profile-123")
-            assert "My Profile 123!" == result.name
+        assert result.id.startswith("my-profile-123")
+        assert "My Profile 123!" == result.name
 
-    def test_create_profile_with_unicode(self, tmp_path):
+    def test_create_profile_with_unicode(self, fake_data_dir, set_data_dir):
         """Test create_profile handles unicode characters."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
+        data_dir = fake_data_dir
 
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        set_data_dir(data_dir)
 
-            from wickit import create_profile
+        result = create_profile("testproduct", "Café Profile")
 
-            result = create_profile("testproduct", "Café Profile")
+        assert "cafe" in result.id or "caf" in result.id
+        assert "Café" in result.name
 
-            assert "cafe" in result.id or "caf" in result.id
-            assert "Café" in result.name
-
-    def test_list_profiles_ignores_files(self, tmp_path):
+    def test_list_profiles_ignores_files(self, populated_data_dir, set_data_dir):
         """Test list_profiles ignores files, only returns directories."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-        (data_dir / "profile1").mkdir()
-        (data_dir / "profile2").mkdir()
-        (data_dir / "notadir.txt").write_text("not a dir")
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
-
-            from wickit import list_profiles
+        set_data_dir(populated_data_dir)
 
-            result = list_profiles("testproduct")
-            assert len(result) == 2
-            ids = [p.id for p in result]
-            assert "profile1" in ids
-            assert "profile2" in ids
+        result = list_profiles("testproduct")
+        ids = {p.id for p in result}
+        assert "notadir.txt" not in ids
+        assert "profile1" in ids
+        assert "profile2" in ids
 
-    def test_delete_profile_nonexistent(self, tmp_path):
+    def test_delete_profile_nonexistent(self, fake_data_dir, set_data_dir):
         """Test delete_profile returns False for non-existent profile."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
+        data_dir = fake_data_dir
 
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        set_data_dir(data_dir)
 
-            from wickit import delete_profile
+        result = delete_profile("testproduct", "nonexistent")
+        assert result is False
 
-            result = delete_profile("testproduct", "nonexistent")
-            assert result is False
-
-    def test_copy_profile_nonexistent_source(self, tmp_path):
+    def test_copy_profile_nonexistent_source(self, fake_data_dir, set_data_dir):
         """Test copy_profile returns None for non-existent source."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        data_dir = fake_data_dir
 
-            from wickit import copy_profile
+        set_data_dir(data_dir)
 
-            result = copy_profile("testproduct", "nonexistent", "Target")
-            assert result is None
+        result = copy_profile("testproduct", "nonexistent", "Target")
+        assert result is None
 
-    def test_set_default_profile_nonexistent(self, tmp_path):
+    def test_set_default_profile_nonexistent(self, fake_data_dir, set_data_dir):
         """Test set_default_profile returns False for non-existent profile."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
+        data_dir = fake_data_dir
 
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        set_data_dir(data_dir)
 
-            from wickit import set_default_profile
+        result = set_default_profile("testproduct", "nonexistent")
+        assert result is False
 
-            result = set_default_profile("testproduct", "nonexistent")
-            assert result is False
-
-    def test_get_default_profile_with_only_non_default(self, tmp_path):
+    def test_get_default_profile_with_only_non_default(self, fake_data_dir, set_data_dir):
         """Test get_default_profile returns first profile when none is marked default."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-        (data_dir / "profile1").mkdir()
-        (data_dir / "profile2").mkdir()
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        data_dir = fake_data_dir
+        for name in ("profile1", "profile2"):
+            os.mkdir(os.path.join(data_dir, name))
 
-            from wickit import get_default_profile
+        set_data_dir(data_dir)
 
-            result = get_default_profile("testproduct")
-            assert result is not None
-            # Should return the first one (sorted alphabetically)
-            assert result.id == "profile1"
+        result = get_default_profile("testproduct")
+        assert result is not None
+        # Should return the first one (sorted alphabetically)
+        assert result.id == "profile1"
 
-    def test_profile_with_metadata_file(self, tmp_path):
+    def test_profile_with_metadata_file(self, populated_data_dir, set_data_dir):
         """Test profile loading reads metadata from file."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-        profile_dir = data_dir / "myprofile"
-        profile_dir.mkdir()
-        metadata = {
-            "name": "My Custom Profile",
-            "created": "2024-01-01T00:00:00",
-            "modified": "2024-01-02T00:00:00"
-        }
-        (profile_dir / ".testproduct.json").write_text(json.dumps(metadata))
-
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
-
-            from wickit import list_profiles
-
-            result = list_profiles("testproduct")
-            assert len(result) == 1
-            assert result[0].name == "My Custom Profile"
-
-    def test_copy_profile_preserves_metadata(self, tmp_path):
-        """Test copy_profile creates new metadata for copied profile."""
-        data_dir = tmp_path / ".testproduct"
-        data_dir.mkdir()
-        source = data_dir / "source"
-        source.mkdir()
-        metadata = {"name": "Source", "created": "2024-01-01", "modified": "2024-01-01"}
-        (source / ".testproduct.json").write_text(json.dumps(metadata))
+        set_data_dir(populated_data_dir)
 
-        with patch("wickit.alter_egos.get_data_dir") as mock_dir:
-            mock_dir.return_value = data_dir
+        result = {p.id: p for p in list_profiles("testproduct")}
+        assert result["myprofile"].name == "My Custom Profile"
+        assert result["myprofile"].created == "2024-01-01T00:00:00"
+
+    def test_copy_profile_preserves_metadata(self, fake_data_dir, set_data_dir):
+        """Test copy_profile creates new metadata for copied profile."""
+        data_dir = fake_data_dir
+        _build_tree(data_dir, {"source/.testproduct.json": _META_SRC})
 
-            from wickit import copy_profile
+        set_data_dir(data_dir)
 
-            result = copy_profile("testproduct", "source", "Target")
+        result = copy_profile("testproduct", "source", "Target")
 
-            assert result is not None
-            assert "target" == result.id
-            assert "Target" == result.name
+        assert result is not None
+        assert "target" == result.id
+        assert "Target" == result.name
 
 
 if __name__ == "__main__":
@@ -1,31 +1,66 @@
 """Tests for omni-kit - Cloud sync strategies."""
 
+import dataclasses
+import email
+import hashlib
+import json
+import os
+import threading
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 import pytest
 
+import wickit
+from wickit import (
+    AutoSync,
+    AutoSyncManager,
+    CloudProvider,
+    CloudSync,
+    DropboxSync,
+    GoogleDriveSync,
+    LocalFolderSync,
+    SyncFolder,
+    SyncResult,
+    SyncStatus,
+    create_sync_folder,
+    detect_cloud_folders,
+    get_default_sync_folder,
+    get_dropbox_folder,
+    get_google_drive_folder,
+    get_icloud_folder,
+    get_onedrive_folder,
+    restore_from_cloud,
+    sync_to_cloud,
+)
+from wickit.cloudbridge import _MultipartRelatedBody, _dropbox_content_hash
+
+
+class TestImports:
+    """Tests for the package's public exports."""
+
+    def test_imports(self):
+        """Test every name in wickit.__all__ resolves."""
+        for name in wickit.__all__:
+            assert hasattr(wickit, name), name
+
 
 class TestCloudProvider:
     """Tests for CloudProvider enum."""
 
     def test_all_providers_defined(self):
         """Test all expected providers are defined."""
-        from wickit import CloudProvider
-
-        expected = ["DROPBOX", "GOOGLE_DRIVE", "ONEDRIVE", "ICLOUD", "MANUAL"]
-        for provider in expected:
-            assert hasattr(CloudProvider, provider)
+        expected = {"DROPBOX", "GOOGLE_DRIVE", "ONEDRIVE", "ICLOUD", "MANUAL"}
+        assert {provider.name for provider in CloudProvider} >= expected
 
     def test_provider_values(self):
         """Test provider string values."""
-        from wickit import CloudProvider
-
-        assert CloudProvider.DROPBOX.value == "dropbox"
-        assert CloudProvider.GOOGLE_DRIVE.value == "google_drive"
-        assert CloudProvider.ONEDRIVE.value == "onedrive"
-        assert CloudProvider.ICLOUD.value == "icloud"
-        assert CloudProvider.MANUAL.value == "manual"
+        assert {provider.name: provider.value for provider in CloudProvider} == {
+            "DROPBOX": "dropbox",
+            "GOOGLE_DRIVE": "google_drive",
+            "ONEDRIVE": "onedrive",
+            "ICLOUD": "icloud",
+            "MANUAL": "manual",
+        }
 
 
 class TestSyncFolder:
@@ -33,8 +68,6 @@ class TestSyncFolder:
 
     def test_sync_folder_creation(self):
         """Test SyncFolder can be created."""
-        from wickit import SyncFolder, CloudProvider
-
         folder = SyncFolder(
             provider=CloudProvider.DROPBOX,
             path=Path("/Dropbox"),
@@ -53,8 +86,6 @@ class TestSyncStatus:
 
     def test_sync_status_creation(self):
         """Test SyncStatus can be created."""
-        from wickit import SyncStatus, CloudProvider
-
         status = SyncStatus(
             provider=CloudProvider.DROPBOX,
             available=True,
@@ -70,25 +101,47 @@ class TestSyncStatus:
         assert status.last_sync == "2024-01-01T00:00:00"
 
 
+@pytest.fixture
+def cloud_dirs(request, fake_home):
+    """Create the requested cloud folder names under the fake home."""
+    for name in request.param:
+        (fake_home / name).mkdir(parents=True)
+    return fake_home
+
+
+@pytest.fixture(scope="class")
+def shared_sync():
+    """LocalFolderSync shared by the tests of a class that only read its state."""
+    sync = LocalFolderSync("jobforge")
+    yield sync
+    sync.disconnect()
+
+
+@pytest.fixture
+def sync():
+    """Fresh LocalFolderSync for tests that change its state."""
+    sync = LocalFolderSync("jobforge")
+    yield sync
+    sync.disconnect()
+
+
+@pytest.fixture
+def autosync_manager():
+    """AutoSyncManager singleton for the current test."""
+    return AutoSyncManager.get_instance()
+
+
 class TestGetDropboxFolder:
     """Tests for get_dropbox_folder function."""
 
-    def test_dropbox_exists_in_home(self, tmp_path, monkeypatch):
+    @pytest.mark.parametrize("cloud_dirs", [("Dropbox",)], indirect=True)
+    def test_dropbox_exists_in_home(self, cloud_dirs):
         """Test Dropbox detection when exists in home."""
-        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
-        (tmp_path / "Dropbox").mkdir()
-
-        from wickit import get_dropbox_folder
-
         result = get_dropbox_folder()
-        assert result == tmp_path / "Dropbox"
+        assert result == cloud_dirs / "Dropbox"
 
-    def test_dropbox_not_exists(self, tmp_path, monkeypatch):
+    def test_dropbox_not_exists(self, fake_home):
         """Test Dropbox returns None when not found."""
-        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
-
-        from wickit import get_dropbox_folder
-
         result = get_dropbox_folder()
         assert result is None
 
@@ -96,22 +149,14 @@ class TestGetDropboxFolder:
 class TestGetGoogleDriveFolder:
     """Tests for get_google_drive_folder function."""
 
-    def test_google_drive_exists(self, tmp_path, monkeypatch):
+    @pytest.mark.parametrize("cloud_dirs", [("Google Drive",)], indirect=True)
+    def test_google_drive_exists(self, cloud_dirs):
         """Test Google Drive detection when exists."""
-        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
-        (tmp_path / "Google Drive").mkdir()
-
-        from wickit import get_google_drive_folder
-
         result = get_google_drive_folder()
-        assert result == tmp_path / "Google Drive"
+        assert result == cloud_dirs / "Google Drive"
 
-    def test_google_drive_not_exists(self, tmp_path, monkeypatch):
+    def test_google_drive_not_exists(self, fake_home):
         """Test Google Drive returns None when not found."""
-        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
-
-        from wickit import get_google_drive_folder
-
         result = get_google_drive_folder()
         assert result is None
 
@@ -119,89 +164,80 @@ class TestGetGoogleDriveFolder:
 class TestGetOneDriveFolder:
     """Tests for get_onedrive_folder function."""
 
-    def test_onedrive_exists(self, tmp_path, monkeypatch):
+    @pytest.mark.parametrize("cloud_dirs", [("OneDrive",)], indirect=True)
+    def test_onedrive_exists(self, cloud_dirs):
         """Test OneDrive detection when exists."""
-        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
-        (tmp_path / "OneDrive").mkdir()
-
-        from wickit.dropzone import get_onedrive_folder
-
         result = get_onedrive_folder()
-        assert result == tmp_path / "OneDrive"
+        assert result == cloud_dirs / "OneDrive"
 
 
 class TestGetICloudFolder:
     """Tests for get_icloud_folder function."""
 
-    def test_icloud_exists(self, tmp_path, monkeypatch):
+    @pytest.mark.parametrize("cloud_dirs", [("Library/Mobile Documents/com~apple~CloudDocs",)], indirect=True)
+    def test_icloud_exists(self, cloud_dirs):
         """Test iCloud detection when exists."""
-        icloud_path = tmp_path / "Library" / "Mobile Documents" / "com~apple~CloudDocs"
-        icloud_path.mkdir(parents=True)
-
-        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
-
-        from wickit.dropzone import get_icloud_folder
-
         result = get_icloud_folder()
-        assert result == icloud_path
+        assert result == cloud_dirs.joinpath("Library", "Mobile Documents", "com~apple~CloudDocs")
 
 
 class TestDetectCloudFolders:
     """Tests for detect_cloud_folders function."""
 
-    def test_detect_no_folders(self, tmp_path, monkeypatch):
+    def test_detect_no_folders(self, fake_home):
         """Test detect_cloud_folders returns empty when no folders exist."""
-        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
-
-        from wickit import detect_cloud_folders
-
         result = detect_cloud_folders()
         assert result == []
 
-    def test_detect_multiple_folders(self, tmp_path, monkeypatch):
+    def test_detect_multiple_folders(self, fs):
         """Test detect_cloud_folders finds multiple folders."""
-        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
-        (tmp_path / "Dropbox").mkdir()
-        (tmp_path / "Google Drive").mkdir()
-        (tmp_path / "OneDrive").mkdir()
-
-        from wickit import detect_cloud_folders
+        home = Path.home()
+        fs.create_dir(home / "Dropbox")
+        fs.create_dir(home / "Google Drive")
+        fs.create_dir(home / "OneDrive")
 
         result = detect_cloud_folders()
         assert len(result) == 3
 
-        providers = [f.provider.value for f in result]
+        providers = {f.provider.value for f in result}
         assert "dropbox" in providers
         assert "google_drive" in providers
         assert "onedrive" in providers
 
+    @pytest.mark.parametrize(
+        "cloud_dirs",
+        [("Documents/Dropbox", "Library/Mobile Documents/com~apple~CloudDocs")],
+        indirect=True,
+    )
+    def test_detect_nested_folders(self, cloud_dirs):
+        """Test detect_cloud_folders finds folders below the home directory's top level."""
+        result = {f.provider: f.path for f in detect_cloud_folders()}
+
+        assert result == {
+            CloudProvider.DROPBOX: cloud_dirs.joinpath("Documents", "Dropbox"),
+            CloudProvider.ICLOUD: cloud_dirs.joinpath("Library", "Mobile Documents", "com~apple~CloudDocs"),
+        }
+
 
 class TestGetDefaultSyncFolder:
     """Tests for get_default_sync_folder function."""
 
-    def test_get_default_sync_folder_dropbox(self, tmp_path, monkeypatch):
+    @pytest.mark.parametrize("cloud_dirs", [("Dropbox",)], indirect=True)
+    def test_get_default_sync_folder_dropbox(self, cloud_dirs):
         """Test get_default_sync_folder for Dropbox."""
-        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
-        (tmp_path / "Dropbox").mkdir()
-
-        from wickit import get_default_sync_folder, CloudProvider
-
         result = get_default_sync_folder(CloudProvider.DROPBOX, "jobforge")
-        assert result == tmp_path / "Dropbox" / "Jobforge"
+        assert result == cloud_dirs.joinpath("Dropbox", "Jobforge")
 
 
 class TestCreateSyncFolder:
     """Tests for create_sync_folder function."""
 
-    def test_create_sync_folder(self, tmp_path, monkeypatch):
+    def test_create_sync_folder(self, fs):
         """Test create_sync_folder creates directory."""
-        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
-        (tmp_path / "Dropbox").mkdir()
-
-        from wickit import create_sync_folder, CloudProvider
+        fs.create_dir(Path.home() / "Dropbox")
 
         result = create_sync_folder(CloudProvider.DROPBOX, "jobforge")
-        expected = tmp_path / "Dropbox" / "Jobforge"
+        expected = Path.home().joinpath("Dropbox", "Jobforge")
         assert result == expected
         assert expected.exists()
 
@@ -209,35 +245,23 @@ class TestCreateSyncFolder:
 class TestLocalFolderSync:
     """Tests for LocalFolderSync class."""
 
-    def test_init(self):
+    def test_init(self, shared_sync):
         """Test LocalFolderSync initialization."""
-        from wickit import LocalFolderSync
+        assert shared_sync.product_name == "jobforge"
+        assert shared_sync.sync_folder is None
+        assert shared_sync.sync_provider is None
 
-        sync = LocalFolderSync("jobforge")
-        assert sync.product_name == "jobforge"
-        assert sync.sync_folder is None
-        assert sync.sync_provider is None
-
-    def test_get_default_folders(self, tmp_path, monkeypatch):
+    @pytest.mark.parametrize("cloud_dirs", [("Dropbox", "Google Drive")], indirect=True)
+    def test_get_default_folders(self, shared_sync, cloud_dirs):
         """Test get_default_folders returns dictionary."""
-        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
-        (tmp_path / "Dropbox").mkdir()
-        (tmp_path / "Google Drive").mkdir()
-
-        from wickit import LocalFolderSync
-
-        sync = LocalFolderSync("jobforge")
-        folders = sync.get_default_folders()
+        folders = shared_sync.get_default_folders()
 
         assert "dropbox" in folders
         assert "drive" in folders
         assert "custom" in folders
 
-    def test_set_folder(self, tmp_path):
+    def test_set_folder(self, sync, tmp_path):
         """Test set_folder updates sync folder."""
-        from wickit import LocalFolderSync
-
-        sync = LocalFolderSync("jobforge")
         test_folder = tmp_path / "test"
         test_folder.mkdir()
 
@@ -247,11 +271,8 @@ class TestLocalFolderSync:
         assert sync.sync_folder == test_folder
         assert sync.sync_provider == "custom"
 
-    def test_disconnect(self):
+    def test_disconnect(self, sync):
         """Test disconnect clears settings."""
-        from wickit import LocalFolderSync
-
-        sync = LocalFolderSync("jobforge")
         sync.sync_folder = Path("/test")
         sync.sync_provider = "dropbox"
 
@@ -260,12 +281,9 @@ class TestLocalFolderSync:
         assert sync.sync_folder is None
         assert sync.sync_provider is None
 
-    def test_get_status(self):
+    def test_get_status(self, shared_sync):
         """Test get_status returns correct status."""
-        from wickit import LocalFolderSync
-
-        sync = LocalFolderSync("jobforge")
-        status = sync.get_status()
+        status = shared_sync.get_status()
 
         assert status["provider"] is None
         assert status["folder"] is None
@@ -277,8 +295,6 @@ class TestSyncResult:
 
     def test_sync_result_success(self):
         """Test SyncResult for successful sync."""
-        from wickit import SyncResult
-
         result = SyncResult(
             success=True,
             message="Synced 10 files",
@@ -292,8 +308,6 @@ class TestSyncResult:
 
     def test_sync_result_failure(self):
         """Test SyncResult for failed sync."""
-        from wickit import SyncResult
-
         result = SyncResult(
             success=False,
             message="Sync failed",
@@ -305,36 +319,405 @@ class TestSyncResult:
         assert result.error == "Connection timeout"
         assert result.files_synced == 0
 
+    def test_sync_result_is_immutable(self):
+        """Test SyncResult is frozen and hashable."""
+        result = SyncResult(success=True, message="ok")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.success = False
+        assert hash(result) == hash(SyncResult(success=True, message="ok"))
+
 
 class TestDropboxSync:
     """Tests for DropboxSync class."""
 
     def test_dropbox_sync_init(self):
         """Test DropboxSync initialization."""
-        from wickit import DropboxSync
-
         sync = DropboxSync()
         assert sync._access_token is None
 
+    def test_session_reused_until_disconnect(self):
+        """Test one pooled HTTP session is shared until disconnect."""
+        pytest.importorskip("requests")
+        sync = DropboxSync()
+
+        session = sync._http()
+        assert sync._http() is session
+
+        sync.disconnect()
+        assert sync._session is None
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests response."""
+
+    def __init__(self, status_code=200, payload=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.content = json.dumps(payload).encode()
+
+    def json(self):
+        return self._payload
+
+
+class RecordingSession:
+    """Records POSTs made through a provider's HTTP session."""
+
+    def __init__(self):
+        self.posts = []
+
+    def post(self, url, headers=None, data=None, **kwargs):
+        body = data.read() if hasattr(data, "read") else bytes(data)
+        self.posts.append((url.rsplit("/", 1)[-1], json.loads(headers["Dropbox-API-Arg"]), body))
+        return FakeResponse(payload={"session_id": "sid"})
+
+    def close(self):
+        pass
+
+
+class TestDropboxUploadSession:
+    """Tests for Dropbox uploads."""
+
+    def test_upload_large_sends_chunks_in_order(self, tmp_path):
+        """Test start/append/finish carry consecutive chunks and offsets."""
+        path = tmp_path / "big.bin"
+        path.write_bytes(b"abcdefghij")
+        sync = DropboxSync()
+        sync._access_token = "token"
+        sync._session = session = RecordingSession()
+
+        assert sync._upload_large(path, "/big.bin", chunk_size=4)
+
+        assert [(name, body) for name, _, body in session.posts] == [
+            ("start", b"abcd"), ("append_v2", b"efgh"), ("finish", b"ij"),
+        ]
+        assert session.posts[1][1]["cursor"] == {"session_id": "sid", "offset": 4}
+        assert session.posts[2][1]["cursor"] == {"session_id": "sid", "offset": 8}
+        assert session.posts[2][1]["commit"]["path"] == "/big.bin"
+
+    def test_upload_switches_to_session_over_limit(self, tmp_path, monkeypatch):
+        """Test upload() uses an upload session above the single-request limit."""
+        monkeypatch.setattr("wickit.cloudbridge._DROPBOX_SINGLE_UPLOAD_LIMIT", 5)
+        path = tmp_path / "big.bin"
+        path.write_bytes(b"abcdefghij")
+        sync = DropboxSync()
+        sync._access_token = "token"
+        sync._session = session = RecordingSession()
+
+        assert sync.upload(path, "/big.bin")
+        assert session.posts[0][0] == "start"
+
+    def test_upload_arg_escapes_path(self, tmp_path):
+        """Test the upload argument header is valid JSON for unusual paths."""
+        path = tmp_path / "d.json"
+        path.write_text("{}")
+        sync = DropboxSync()
+        sync._access_token = "token"
+        sync._session = session = RecordingSession()
+
+        assert sync.upload(path, '/app/"quoted" café.json')
+
+        assert session.posts[0][1] == {
+            "path": '/app/"quoted" café.json', "mode": "overwrite", "autorename": False, "mute": False,
+        }
+
+
+class TestDropboxContentHash:
+    """Tests for the Dropbox content_hash algorithm."""
+
+    def test_hashes_each_block_then_the_digests(self, tmp_path, monkeypatch):
+        """Test the hash is SHA-256 over the per-block SHA-256 digests."""
+        monkeypatch.setattr("wickit.cloudbridge._DROPBOX_HASH_BLOCK_SIZE", 4)
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"abcdefghij")
+
+        blocks = [hashlib.sha256(block).digest() for block in (b"abcd", b"efgh", b"ij")]
+        assert _dropbox_content_hash(path) == hashlib.sha256(b"".join(blocks)).hexdigest()
+
+
+class MetadataSession:
+    """Answers Dropbox get_metadata requests from a path -> hash map."""
+
+    def __init__(self, hashes):
+        self.hashes = hashes
+        self.paths = []
+
+    def post(self, url, headers=None, data=None, **kwargs):
+        path = json.loads(data)["path"]
+        self.paths.append(path)
+        if path not in self.hashes:
+            return FakeResponse(status_code=409, payload={"error_summary": "path/not_found/"})
+        return FakeResponse(payload={".tag": "file", "path_lower": path, "content_hash": self.hashes[path]})
+
+    def close(self):
+        pass
+
+
+class TestDropboxRemoteHash:
+    """Tests for single-file Dropbox hash lookups."""
+
+    def test_remote_hash_reads_file_metadata(self):
+        """Test remote_hash returns the file's content_hash, or None if missing."""
+        sync = DropboxSync()
+        sync._access_token = "token"
+        sync._session = MetadataSession({"/a.json": "h:a"})
+
+        assert sync.remote_hash("/a.json") == "h:a"
+        assert sync.remote_hash("/missing.json") is None
+        assert sync._session.paths == ["/a.json", "/missing.json"]
+
+
+class PagedListSession:
+    """Serves a Dropbox folder listing split across pages."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+        self.paths = []
+
+    def post(self, url, headers=None, data=None, **kwargs):
+        endpoint = url.split("/files/", 1)[-1]
+        self.calls.append(endpoint)
+        if endpoint == "upload":
+            return FakeResponse()
+        if endpoint == "list_folder":
+            self.paths.append(json.loads(data)["path"])
+        index = 0 if endpoint == "list_folder" else int(json.loads(data)["cursor"])
+        entries = [{"path_lower": path} for path in self.pages[index]]
+        has_more = index + 1 < len(self.pages)
+        return FakeResponse(payload={"entries": entries, "has_more": has_more, "cursor": str(index + 1)})
+
+    def close(self):
+        pass
+
+
+class TestDropboxListFiles:
+    """Tests for Dropbox folder listing."""
+
+    @pytest.fixture
+    def paged_sync(self):
+        """DropboxSync whose listing spans three pages."""
+        sync = DropboxSync()
+        sync._access_token = "token"
+        sync._session = PagedListSession([["/app/a"], ["/app/b"], ["/app/c"]])
+        return sync
+
+    def test_list_files_follows_cursor(self, paged_sync):
+        """Test every page of a listing is returned."""
+        assert paged_sync.list_files("/app") == ["/app/a", "/app/b", "/app/c"]
+        assert paged_sync._session.calls == ["list_folder", "list_folder/continue", "list_folder/continue"]
+
+    def test_list_files_is_cached(self, paged_sync):
+        """Test a repeated listing within the TTL skips the API."""
+        paged_sync.list_files("/app")
+        paged_sync.list_files("/App/")
+
+        assert paged_sync._session.calls.count("list_folder") == 1
+
+    def test_root_is_listed_as_empty_path(self, paged_sync):
+        """Test the root folder is requested as "" as Dropbox requires."""
+        paged_sync.list_files("/")
+
+        assert paged_sync._session.paths == [""]
+
+    def test_upload_invalidates_listing(self, paged_sync, tmp_path):
+        """Test uploading into a folder drops its cached listing."""
+        path = tmp_path / "d.json"
+        path.write_text("{}")
+        paged_sync.list_files("/app")
+
+        assert paged_sync.upload(path, "/app/d.json")
+        paged_sync.list_files("/app")
+
+        assert paged_sync._session.calls.count("list_folder") == 2
+
 
 class TestGoogleDriveSync:
     """Tests for GoogleDriveSync class."""
 
     def test_google_drive_sync_init(self):
         """Test GoogleDriveSync initialization."""
-        from wickit import GoogleDriveSync
-
         sync = GoogleDriveSync()
         assert sync._access_token is None
 
+    def test_upload_sends_multipart_body(self, tmp_path):
+        """Test upload streams metadata and file content as multipart/related."""
+        path = tmp_path / "notes.json"
+        path.write_bytes(b'{"a": 1}')
+        sent = {}
+
+        class Session:
+            def post(self, url, params=None, headers=None, data=None):
+                sent.update(url=url, params=params, headers=headers, body=data.read(), length=len(data))
+                return FakeResponse()
+
+        sync = GoogleDriveSync()
+        sync._access_token = "token"
+        sync._session = Session()
+
+        assert sync.upload(path, "/apps/notes.json")
+
+        assert sent["url"].endswith("/upload/drive/v3/files")
+        assert sent["params"]["uploadType"] == "multipart"
+        assert sent["length"] == len(sent["body"])
+        message = email.message_from_bytes(
+            f"Content-Type: {sent['headers']['Content-Type']}\r\n\r\n".encode() + sent["body"]
+        )
+        metadata, content = message.get_payload()
+        assert json.loads(metadata.get_payload()) == {"name": "notes.json"}
+        assert content.get_payload(decode=True) == b'{"a": 1}'
+
+    def test_multipart_body_rewinds_for_retry(self, tmp_path):
+        """Test the multipart body replays identically after seek(0)."""
+        path = tmp_path / "notes.json"
+        path.write_bytes(b"x" * 10_000)
+        with open(path, "rb") as f:
+            body = _MultipartRelatedBody({"name": "notes.json"}, f)
+            first = body.read(4096) + body.read()
+            assert body.tell() == len(body) == len(first)
+
+            body.seek(0)
+            assert body.read() == first
+
+
+class FakeCloudSync(CloudSync):
+    """In-memory CloudSync that records transfers."""
+
+    def __init__(self):
+        self.uploaded = {}
+        self.remote = {}
+        self.disconnected = False
+
+    def connect(self, access_token):
+        return access_token == "token"
+
+    def upload(self, local_path, remote_path):
+        self.uploaded[remote_path] = Path(local_path).read_bytes()
+        return True
+
+    def download(self, remote_path, local_path):
+        local_path.write_bytes(self.remote[remote_path])
+        return True
+
+    def list_files(self, folder_path):
+        return list(self.remote)
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+@pytest.fixture
+def fake_cloud(monkeypatch):
+    """Route cloudbridge provider lookups to a FakeCloudSync."""
+    cloud = FakeCloudSync()
+    monkeypatch.setattr("wickit.cloudbridge.get_cloud_sync_provider", lambda name: cloud)
+    return cloud
+
+
+class TestSyncToCloud:
+    """Tests for sync_to_cloud."""
+
+    def test_uploads_all_tracked_files(self, fake_home, fake_cloud):
+        """Test every file outside hidden and backup dirs is uploaded."""
+        product_dir = fake_home / ".jobforge"
+        for rel in ("a.json", "profile/b.json", "export.zip", ".backups/c.json"):
+            path = product_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(rel)
+
+        result = sync_to_cloud("jobforge", "dropbox", "token", cloud_folder="/apps")
+
+        assert result.success
+        assert result.files_synced == 2
+        assert fake_cloud.uploaded == {"/apps/a.json": b"a.json", "/apps/profile/b.json": b"profile/b.json"}
+
+    @pytest.mark.parametrize("cloud_folder,prefix", [
+        pytest.param("/apps", "/apps", id="subfolder"),
+        pytest.param("/", "", id="root"),
+    ])
+    def test_skips_files_with_matching_remote_hash(self, fake_home, fake_cloud, monkeypatch, cloud_folder, prefix):
+        """Test files whose remote content hash matches are not uploaded."""
+        product_dir = fake_home / ".jobforge"
+        product_dir.mkdir()
+        (product_dir / "same.json").write_text("same")
+        (product_dir / "changed.json").write_text("new")
+        remote = {f"{prefix}/same.json": "h:same", f"{prefix}/changed.json": "h:old"}
+        monkeypatch.setattr(fake_cloud, "remote_hashes", lambda folder: remote)
+        monkeypatch.setattr(fake_cloud, "remote_hash", remote.get)
+        monkeypatch.setattr(fake_cloud, "content_hash", lambda path: f"h:{path.read_text()}")
+
+        result = sync_to_cloud("jobforge", "dropbox", "token", cloud_folder=cloud_folder)
+
+        assert result.files_synced == 2
+        assert list(fake_cloud.uploaded) == [f"{prefix}/changed.json"]
+
+    @pytest.mark.parametrize("cloud_folder,listed", [
+        pytest.param("/apps", ["/apps"], id="subfolder"),
+        pytest.param("/", [], id="root"),
+    ])
+    def test_lists_only_the_uploaded_subtree(self, fake_home, fake_cloud, monkeypatch, cloud_folder, listed):
+        """Test remote hashes are listed below cloud_folder, never for the account root."""
+        product_dir = fake_home / ".jobforge"
+        (product_dir / "profile").mkdir(parents=True)
+        (product_dir / "a.json").write_text("a")
+        (product_dir / "profile" / "b.json").write_text("b")
+        folders = []
+        monkeypatch.setattr(fake_cloud, "remote_hashes", lambda folder: folders.append(folder) or {})
+
+        sync_to_cloud("jobforge", "dropbox", "token", cloud_folder=cloud_folder)
+
+        assert folders == listed
+
+    def test_missing_product_dir_uploads_nothing(self, fake_home, fake_cloud):
+        """Test a product without a data directory syncs zero files."""
+        result = sync_to_cloud("jobforge", "dropbox", "token")
+
+        assert result.success
+        assert result.files_synced == 0
+
+    def test_connect_failure(self, fake_home, fake_cloud):
+        """Test a failed connection is reported without uploading."""
+        result = sync_to_cloud("jobforge", "dropbox", "bad-token")
+
+        assert not result.success
+        assert fake_cloud.uploaded == {}
+        assert fake_cloud.disconnected
+
+
+class TestRestoreFromCloud:
+    """Tests for restore_from_cloud."""
+
+    def test_downloads_all_remote_files(self, fake_home, fake_cloud):
+        """Test every non-archive remote file is restored."""
+        fake_cloud.remote = {f"/apps/{i}.json": str(i).encode() for i in range(20)}
+        fake_cloud.remote["/apps/export.zip"] = b"zip"
+
+        result = restore_from_cloud("jobforge", "dropbox", "token", cloud_folder="/apps")
+
+        assert result.success
+        assert result.files_synced == 20
+        product_dir = fake_home / ".jobforge"
+        assert sorted(p.name for p in product_dir.iterdir()) == sorted(f"{i}.json" for i in range(20))
+        assert (product_dir / "7.json").read_bytes() == b"7"
+
+    def test_failure_still_disconnects(self, fake_home, fake_cloud, monkeypatch):
+        """Test the provider is disconnected when listing raises."""
+        def fail(folder_path):
+            raise RuntimeError("listing failed")
+
+        monkeypatch.setattr(fake_cloud, "list_files", fail)
+
+        result = restore_from_cloud("jobforge", "dropbox", "token")
+
+        assert not result.success
+        assert fake_cloud.disconnected
+
 
 class TestAutoSync:
     """Tests for AutoSync class."""
 
     def test_auto_sync_init(self):
         """Test AutoSync initialization."""
-        from wickit import AutoSync
-
         sync = AutoSync(
             product_dir=Path("/test"),
             provider="dropbox",
@@ -349,57 +732,230 @@ class TestAutoSync:
 
     def test_auto_sync_set_access_token(self):
         """Test AutoSync.set_access_token method."""
-        from wickit import AutoSync
-
         sync = AutoSync(product_dir=Path("/test"))
         sync.set_access_token("new-token")
 
         assert sync._access_token == "new-token"
 
+    def test_compute_hash_matches_blake2b(self, tmp_path):
+        """Test _compute_hash returns the BLAKE2b digest of the file."""
+        content = b'{"key": "value"}' * 10000
+        path = tmp_path / "data.json"
+        path.write_bytes(content)
+
+        sync = AutoSync(product_dir=tmp_path, canonicalize_json=False)
+        assert sync._compute_hash(path) == hashlib.blake2b(content).hexdigest()
+
+    def test_iter_tracked_skips_hidden_dirs(self, tmp_path):
+        """Test _iter_tracked yields JSON files outside hidden and backup dirs."""
+        for rel in ("a.json", "notes.txt", "sub/b.json", ".backups/c.json", ".cache/d.json"):
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("{}")
+
+        sync = AutoSync(product_dir=tmp_path)
+        tracked = set(sync._iter_tracked(tmp_path))
+
+        assert tracked == {str(tmp_path / "a.json"), str(tmp_path / "sub" / "b.json")}
+
+    def test_compute_hash_ignores_json_formatting(self, tmp_path):
+        """Test reformatted JSON hashes the same unless canonicalization is off."""
+        compact = tmp_path / "compact.json"
+        pretty = tmp_path / "pretty.json"
+        compact.write_text('{"b": 1, "a": [1, 2]}')
+        pretty.write_text('{\n  "a": [1, 2],\n  "b": 1\n}\n')
+
+        sync = AutoSync(product_dir=tmp_path)
+        assert sync._compute_hash(compact) == sync._compute_hash(pretty)
+
+        raw = AutoSync(product_dir=tmp_path, canonicalize_json=False)
+        assert raw._compute_hash(compact) != raw._compute_hash(pretty)
+
+    def test_is_tracked_path(self):
+        """Test _is_tracked_path applies the same filters as _iter_tracked."""
+        sync = AutoSync(product_dir=Path("/data/.jobforge"))
+
+        assert sync._is_tracked_path("/data/.jobforge/profile/config.json")
+        assert not sync._is_tracked_path("/data/.jobforge/.backups/config.json")
+        assert not sync._is_tracked_path("/data/.jobforge/notes.txt")
+        assert not sync._is_tracked_path("/elsewhere/config.json")
+
+    def test_scan_changes_hashes_bursts_in_parallel(self, tmp_path):
+        """Test several new files are hashed through the pool and all reported."""
+        paths = [tmp_path / f"file{i}.json" for i in range(5)]
+        for i, path in enumerate(paths):
+            path.write_text(f'{{"n": {i}}}')
+
+        sync = AutoSync(product_dir=tmp_path)
+        try:
+            assert sorted(sync._scan_changes()) == sorted(str(path) for path in paths)
+            assert sync._hash_pool is not None
+        finally:
+            sync.stop()
+        assert sync._hash_pool is None
+
+    def test_scan_changes_ignores_quick_recreate(self, tmp_path):
+        """Test a file deleted and re-created with the same content is not a change."""
+        sync = AutoSync(product_dir=tmp_path)
+        path = tmp_path / "data.json"
+        path.write_text('{"a": 1}')
+        sync._scan_changes()
+
+        path.unlink()
+        assert sync._scan_changes() == []
+        assert str(path) not in sync._file_meta
+
+        path.write_text('{"a": 1}')
+        assert sync._scan_changes() == []
+
+    def test_notify_sync_survives_failing_callback(self, tmp_path):
+        """Test one failing callback does not stop the others from running."""
+        results = []
+        calls = []
+
+        def failing():
+            raise RuntimeError("boom")
+
+        sync = AutoSync(product_dir=tmp_path, on_sync=results.append)
+        sync.add_callback(failing)
+        sync.add_callback(lambda: calls.append("called"))
+
+        sync._notify_sync()
+
+        assert results == [{"success": False, "message": "No access token set"}]
+        assert calls == ["called"]
+
+    def test_observer_ignores_file_access_events(self, tmp_path, monkeypatch):
+        """Test only change events on tracked files reach the event queue."""
+        from watchdog import events
+
+        handlers = []
+
+        class FakeObserver:
+            daemon = False
+
+            def schedule(self, handler, path, recursive=False):
+                handlers.append(handler)
+
+            def start(self):
+                pass
+
+        monkeypatch.setattr("watchdog.observers.Observer", FakeObserver)
+        sync = AutoSync(product_dir=tmp_path)
+        assert sync._start_observer()
+        path = str(tmp_path / "data.json")
+
+        for event in (events.FileOpenedEvent(path), events.FileClosedEvent(path),
+                      events.FileClosedNoWriteEvent(path), events.FileModifiedEvent(path)):
+            handlers[0].dispatch(event)
+
+        assert sync._events.get_nowait().event_type == "modified"
+        assert sync._events.empty()
+
+    def test_stop_does_not_wait_for_poll_interval(self, tmp_path):
+        """Test stop() returns without waiting out the watch loop's sleep."""
+        sync = AutoSync(product_dir=tmp_path, debounce_seconds=30.0)
+        sync.start()
+        thread = sync._thread
+        sync.stop()
+
+        # stop() joins with a 5s timeout; a loop still sleeping out the 30s
+        # interval would leave the thread alive.
+        assert sync._stop_event.is_set()
+        assert not thread.is_alive()
+        assert not sync.is_running()
+
+    def test_iter_tracked_reuses_listing_until_dir_mtime_changes(self, tmp_path):
+        """Test a directory is re-listed only when its mtime changes."""
+        sync = AutoSync(product_dir=tmp_path)
+        (tmp_path / "a.json").write_text("{}")
+        os.utime(tmp_path, ns=(10**18, 10**18))
+        assert list(sync._iter_tracked(tmp_path)) == [str(tmp_path / "a.json")]
+
+        (tmp_path / "b.json").write_text("{}")
+        os.utime(tmp_path, ns=(10**18, 10**18))
+        assert list(sync._iter_tracked(tmp_path)) == [str(tmp_path / "a.json")]
+
+        os.utime(tmp_path, ns=(10**18 + 10**9, 10**18 + 10**9))
+        assert len(list(sync._iter_tracked(tmp_path))) == 2
+
+    def test_scan_changes_reports_content_changes(self, tmp_path):
+        """Test _scan_changes reports new and modified files only."""
+        sync = AutoSync(product_dir=tmp_path)
+        path = tmp_path / "data.json"
+        path.write_text('{"a": 1}')
+
+        assert sync._scan_changes() == [str(path)]
+        assert sync._scan_changes() == []
+
+        # Same content with a new mtime is not a change.
+        mtime_ns = path.stat().st_mtime_ns + 10**9
+        path.write_text('{"a": 1}')
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        assert sync._scan_changes() == []
+
+        path.write_text('{"a": 2}')
+        os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        assert sync._scan_changes() == [str(path)]
+
 
 class TestAutoSyncManager:
     """Tests for AutoSyncManager class."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_autosync(self):
+        """Reset the AutoSyncManager singleton after every test."""
+        yield
+        AutoSyncManager.reset()
+
     def test_auto_sync_manager_init(self):
         """Test AutoSyncManager initialization."""
-        from wickit import AutoSyncManager
-
         manager = AutoSyncManager()
         assert manager._sync is None
 
-    def test_auto_sync_manager_singleton(self):
+    def test_auto_sync_manager_singleton(self, autosync_manager):
         """Test AutoSyncManager is a singleton."""
-        from wickit import AutoSyncManager
+        assert AutoSyncManager.get_instance() is autosync_manager
 
-        manager1 = AutoSyncManager.get_instance()
-        manager2 = AutoSyncManager.get_instance()
+    def test_get_instance_is_thread_safe(self):
+        """Test concurrent first calls to get_instance share one instance."""
+        barrier = threading.Barrier(8)
+        instances = []
 
-        assert manager1 is manager2
+        def worker():
+            barrier.wait()
+            instances.append(AutoSyncManager.get_instance())
 
-        AutoSyncManager.reset()
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(instance) for instance in instances}) == 1
 
 
 class TestSyncEdgeCases:
     """Edge case tests for sync module."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_autosync(self):
+        """Reset the AutoSyncManager singleton after every test."""
+        yield
+        AutoSyncManager.reset()
+
     def test_cloud_provider_from_value(self):
         """Test CloudProvider enum from value."""
-        from wickit import CloudProvider
-
         dropbox = CloudProvider("dropbox")
         assert dropbox == CloudProvider.DROPBOX
 
     def test_cloud_provider_equality(self):
         """Test CloudProvider equality."""
-        from wickit import CloudProvider
-
         assert CloudProvider.DROPBOX == CloudProvider.DROPBOX
         assert CloudProvider.DROPBOX != CloudProvider.GOOGLE_DRIVE
 
     def test_sync_folder_with_none_project_path(self):
         """Test SyncFolder with None project_path."""
-        from wickit import SyncFolder, CloudProvider
-
         folder = SyncFolder(
             provider=CloudProvider.DROPBOX,
             path=Path("/Dropbox"),
@@ -411,8 +967,6 @@ class TestSyncEdgeCases:
 
     def test_sync_status_with_none_last_sync(self):
         """Test SyncStatus with None last_sync."""
-        from wickit import SyncStatus, CloudProvider
-
         status = SyncStatus(
             provider=CloudProvider.DROPBOX,
             available=True,
@@ -423,42 +977,30 @@ class TestSyncEdgeCases:
 
         assert status.last_sync is None
 
-    def test_local_folder_sync_status_when_disconnected(self):
+    def test_local_folder_sync_status_when_disconnected(self, shared_sync):
         """Test LocalFolderSync get_status when disconnected."""
-        from wickit import LocalFolderSync
-
-        sync = LocalFolderSync("jobforge")
-        status = sync.get_status()
+        status = shared_sync.get_status()
 
         assert status["connected"] is False
         assert status["provider"] is None
         assert status["folder"] is None
 
-    def test_local_folder_sync_set_invalid_folder(self):
+    def test_local_folder_sync_set_invalid_folder(self, sync):
         """Test LocalFolderSync.set_folder with non-existent folder."""
-        from wickit import LocalFolderSync
-
-        sync = LocalFolderSync("jobforge")
         result = sync.set_folder("/nonexistent/path", "custom")
 
         # set_folder doesn't check if path exists, it just stores it
         assert result is False
         assert sync.sync_provider == "custom"
 
-    def test_auto_sync_manager_start_stop(self, tmp_path, monkeypatch):
+    @pytest.mark.parametrize("cloud_dirs", [("Dropbox",)], indirect=True)
+    def test_auto_sync_manager_start_stop(self, autosync_manager, cloud_dirs):
         """Test AutoSyncManager start and stop."""
-        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
-        (tmp_path / "Dropbox").mkdir()
-
-        from wickit import AutoSyncManager
-
-        manager = AutoSyncManager.get_instance()
-
         # First stop any existing sync
-        manager.stop_autosync()
+        autosync_manager.stop_autosync()
 
-        result = manager.start_autosync(
-            product_dir=tmp_path / "test",
+        result = autosync_manager.start_autosync(
+            product_dir=cloud_dirs / "test",
             provider="dropbox",
             debounce_seconds=1.0
         )
@@ -466,9 +1008,7 @@ class TestSyncEdgeCases:
         # Provider is valid but we need access token
         # This may return True or False depending on implementation
         # Just verify it doesn't crash
-        manager.stop_autosync()
-
-        AutoSyncManager.reset()
+        autosync_manager.stop_autosync()
 
 
 if __name__ == "__main__":
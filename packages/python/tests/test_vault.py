@@ -0,0 +1,269 @@
+"""Tests for wickit - vault SQLite database wrapper."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path):
+    """SQLiteDatabase stored under a temporary data directory."""
+    with patch("wickit.vault.get_data_dir") as mock_dir:
+        mock_dir.return_value = tmp_path
+
+        from wickit.vault import SQLiteDatabase
+
+        database = SQLiteDatabase("testproduct")
+        database.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+        yield database
+        database.close()
+
+
+class TestQueries:
+    """Tests for table creation and basic CRUD helpers."""
+
+    def test_insert_and_select(self, db):
+        """Test inserted rows are returned as dicts."""
+        db.insert("users", {"id": 1, "name": "John"})
+
+        assert db.select("users") == [{"id": 1, "name": "John"}]
+
+    def test_select_with_where(self, db):
+        """Test select filters rows with a where clause."""
+        db.insert("users", {"id": 1, "name": "John"})
+        db.insert("users", {"id": 2, "name": "Jane"})
+
+        assert db.select("users", "name", "id = ?", (2,)) == [{"name": "Jane"}]
+
+    def test_create_table_with_constraints(self, db):
+        """Test create_table appends table constraints."""
+        db.create_table("pairs", {"a": "INTEGER", "b": "INTEGER"}, ["PRIMARY KEY (a, b)"])
+
+        pk_columns = [col["name"] for col in db.get_table_info("pairs") if col["pk"]]
+        assert pk_columns == ["a", "b"]
+
+    def test_prepare_insert_run_many(self, db):
+        """Test a prepared insert is reusable across rows."""
+        prepared = db.prepare_insert("users", ["name", "id"])
+        prepared.run(("John", 1))
+        prepared.run_many([("Jane", 2), ("Jim", 3)])
+
+        assert [row["name"] for row in db.select("users")] == ["John", "Jane", "Jim"]
+
+    def test_bulk_setup(self, db):
+        """Test bulk_setup creates tables, rows and indexes together."""
+        db.bulk_setup(
+            ["CREATE TABLE jobs (id INTEGER, title TEXT)"],
+            ["CREATE INDEX idx_jobs_title ON jobs (title)"],
+            [("INSERT INTO jobs VALUES (?, ?)", [(1, "Engineer"), (2, "Designer")])],
+        )
+
+        assert len(db.select("jobs")) == 2
+        indexes = db.execute_query("SELECT name FROM sqlite_master WHERE type='index'")
+        assert {"name": "idx_jobs_title"} in indexes
+
+
+class TestTransactions:
+    """Tests for transaction handling."""
+
+    def test_transaction_commits(self, db):
+        """Test writes inside a transaction are committed together."""
+        with db.transaction():
+            db.insert("users", {"id": 1, "name": "John"})
+            db.insert("users", {"id": 2, "name": "Jane"})
+            assert db.in_transaction
+
+        assert not db.in_transaction
+        assert len(db.select("users")) == 2
+
+    def test_transaction_rolls_back(self, db):
+        """Test a failing transaction discards all of its writes."""
+        from wickit.vault import DatabaseError
+
+        with pytest.raises(DatabaseError):
+            with db.transaction():
+                db.insert("users", {"id": 1, "name": "John"})
+                db.insert("users", {"id": 1, "name": "Duplicate"})
+
+        assert db.select("users") == []
+
+    def test_transaction_class(self, db):
+        """Test the Transaction context manager shares the connection."""
+        from wickit.vault import Transaction
+
+        with pytest.raises(RuntimeError):
+            with Transaction(db):
+                db.insert("users", {"id": 1, "name": "John"})
+                raise RuntimeError("abort")
+
+        assert db.select("users") == []
+
+    def test_nested_transaction_joins_outer(self, db):
+        """Test execute_many inside a transaction is rolled back with it."""
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.execute_many("INSERT INTO users VALUES (?, ?)", [(1, "John"), (2, "Jane")])
+                raise RuntimeError("abort")
+
+        assert db.select("users") == []
+
+
+class TestRowFactory:
+    """Tests for execute_query row types."""
+
+    def test_namedtuple_rows(self, db):
+        """Test namedtuple rows expose columns as attributes."""
+        db.insert("users", {"id": 1, "name": "John"})
+
+        rows = db.execute_query("SELECT id, name FROM users", row_factory="namedtuple")
+        assert rows[0].name == "John"
+        assert rows[0] == (1, "John")
+
+    def test_tuple_rows(self, db):
+        """Test tuple rows are returned unchanged."""
+        db.insert("users", {"id": 1, "name": "John"})
+
+        assert db.execute_query("SELECT id, name FROM users", row_factory="tuple") == [(1, "John")]
+
+    def test_unknown_row_factory(self, db):
+        """Test an unknown row factory is rejected."""
+        with pytest.raises(ValueError):
+            db.execute_query("SELECT * FROM users", row_factory="object")
+
+
+class TestBackup:
+    """Tests for backup and restore."""
+
+    def test_backup_and_restore(self, db, tmp_path):
+        """Test a backup restores rows written before it was taken."""
+        backup_path = tmp_path / "backup.db"
+        db.insert("users", {"id": 1, "name": "John"})
+        db.backup(backup_path)
+        db.insert("users", {"id": 2, "name": "Jane"})
+
+        db.restore(backup_path)
+
+        assert db.select("users") == [{"id": 1, "name": "John"}]
+
+    def test_backup_reports_progress(self, db, tmp_path):
+        """Test backup invokes the progress callback per step."""
+        steps = []
+        db.insert("users", {"id": 1, "name": "John"})
+
+        db.backup(tmp_path / "backup.db", pages=1, sleep=0, progress=lambda *args: steps.append(args))
+
+        assert steps
+        assert steps[-1][1] == 0
+
+    def test_restore_missing_backup(self, db, tmp_path):
+        """Test restoring a missing backup raises DatabaseError."""
+        from wickit.vault import DatabaseError
+
+        with pytest.raises(DatabaseError):
+            db.restore(tmp_path / "missing.db")
+
+
+class TestGetDatabase:
+    """Tests for get_database."""
+
+    def test_get_database_reuses_instance(self, tmp_path):
+        """Test get_database returns the same instance per product and file."""
+        with patch("wickit.vault.get_data_dir") as mock_dir:
+            mock_dir.return_value = tmp_path
+
+            from wickit.vault import get_database
+
+            get_database.cache_clear()
+            try:
+                assert get_database("testproduct") is get_database("testproduct")
+                assert get_database("testproduct") is not get_database("testproduct", "other.db")
+            finally:
+                get_database.cache_clear()
+
+    def test_get_database_ignores_call_spelling(self, tmp_path):
+        """Test default, positional and keyword db_name share one instance."""
+        with patch("wickit.vault.get_data_dir") as mock_dir:
+            mock_dir.return_value = tmp_path
+
+            from wickit.vault import get_database
+
+            get_database.cache_clear()
+            try:
+                db = get_database("testproduct")
+                assert get_database("testproduct", "database.db") is db
+                assert get_database("testproduct", db_name="database.db") is db
+                assert get_database(product_name="testproduct") is db
+            finally:
+                get_database.cache_clear()
+
+
+class TestThreading:
+    """Tests for per-thread connections."""
+
+    def test_threads_use_own_connections(self, db):
+        """Test writes from worker threads are visible to the caller."""
+        import threading
+
+        connections = []
+
+        def worker(user_id):
+            with db.get_connection() as conn:
+                connections.append(conn)
+            db.insert("users", {"id": user_id, "name": f"user{user_id}"})
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(db.select("users")) == 4
+        assert len({id(conn) for conn in connections}) == 4
+
+
+    def test_thread_connections_close_when_threads_end(self, db):
+        """Test a finished worker thread's connection is closed and forgotten."""
+        import sqlite3
+        import threading
+
+        connections = []
+
+        def worker():
+            with db.get_connection() as conn:
+                connections.append(conn)
+            db.select("users")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(connections) == 4
+        assert not set(connections) & db._connections
+        for conn in connections:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+
+class TestVacuum:
+    """Tests for vacuum helpers."""
+
+    def test_new_database_uses_incremental_auto_vacuum(self, db):
+        """Test new databases are created with incremental auto-vacuum."""
+        rows = db.execute_query("PRAGMA auto_vacuum", row_factory="tuple")
+        assert rows == [(2,)]
+
+    def test_vacuum_reclaims_free_pages(self, db):
+        """Test vacuum releases pages freed by deletes."""
+        db.execute_many("INSERT INTO users VALUES (?, ?)", [(i, "x" * 500) for i in range(200)])
+        db.delete("users", "1 = 1")
+        assert db.execute_query("PRAGMA freelist_count", row_factory="tuple")[0][0] > 0
+
+        db.vacuum()
+
+        assert db.execute_query("PRAGMA freelist_count", row_factory="tuple") == [(0,)]
+
+    def test_vacuum_full(self, db):
+        """Test vacuum_full runs a complete VACUUM."""
+        assert db.vacuum_full() is True